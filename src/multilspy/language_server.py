@@ -119,7 +119,7 @@ class LanguageServer:
         elif config.code_language in [Language.C, Language.CPP]:
             from multilspy.language_servers.clangd.clangd import ClangdServer
 
-            return ClangdServer(config, logger, repository_root_path)
+            return ClangdServer.acquire(config, logger, repository_root_path)
         else:
             logger.log(f"Language {config.code_language} is not supported", logging.ERROR)
             raise MultilspyException(f"Language {config.code_language} is not supported")
@@ -3,21 +3,333 @@ Provides C/C++ specific instantiation of the LanguageServer class. Contains vari
 """
 
 import asyncio
+import copy
+import dataclasses
+import functools
+import hashlib
 import json
 import logging
 import os
 import stat
 import pathlib
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+
+import psutil
 
 from multilspy.multilspy_logger import MultilspyLogger
 from multilspy.language_server import LanguageServer
 from multilspy.lsp_protocol_handler.server import ProcessLaunchInfo
 from multilspy.lsp_protocol_handler.lsp_types import InitializeParams
 from multilspy.multilspy_config import MultilspyConfig
+from multilspy.multilspy_exceptions import MultilspyException
 from multilspy.multilspy_utils import FileUtils
-from multilspy.multilspy_utils import PlatformUtils
+from multilspy.multilspy_utils import PlatformId, PlatformUtils
+from multilspy.multilspy_settings import MultilspySettings
+
+
+# The initialize params template is parsed once at import time and deep-copied per server start
+_INIT_PARAMS_TEMPLATE = FileUtils.read_json(str(pathlib.Path(__file__).with_name("initialize_params.json")))
+del _INIT_PARAMS_TEMPLATE["_description"]
+assert _INIT_PARAMS_TEMPLATE["rootPath"] == "$rootPath"
+assert _INIT_PARAMS_TEMPLATE["rootUri"] == "$rootUri"
+assert _INIT_PARAMS_TEMPLATE["workspaceFolders"][0]["uri"] == "$uri"
+assert _INIT_PARAMS_TEMPLATE["workspaceFolders"][0]["name"] == "$name"
+
+# Runtime dependencies are parsed once at import time and indexed by platform id
+_RUNTIME_DEPS = {
+    dependency["platformId"]: dependency
+    for dependency in FileUtils.read_json(
+        str(pathlib.Path(__file__).with_name("runtime_dependencies.json"))
+    )["runtimeDependencies"]
+}
+
+# Directories of common clangd installations per platform family, computed once at import time
+_COMMON_DIRS = {
+    "osx": (
+        "/opt/homebrew/bin",
+        "/usr/local/bin",
+        "/usr/bin",
+        "/Applications/Xcode.app/Contents/Developer/Toolchains/XcodeDefault.xctoolchain/usr/bin",
+        os.path.expanduser("~/Library/Application Support/Code/User/globalStorage/llvm-vs-code-extensions.vscode-clangd/install/clangd_16/bin"),
+    ),
+    "linux": (
+        "/usr/bin",
+        "/usr/local/bin",
+        "/snap/bin",
+        "/opt/clangd/bin",
+        os.path.expanduser("~/.local/bin"),
+        os.path.expanduser("~/.vscode/extensions/llvm-vs-code-extensions.vscode-clangd/install/clangd_16/bin"),
+    ),
+    "win": (
+        os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "LLVM", "bin"),
+        os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "LLVM", "bin"),
+        os.path.join(os.environ.get("USERPROFILE", "C:\\Users\\Default"), ".vscode", "extensions", "llvm-vs-code-extensions.vscode-clangd", "install", "clangd_16", "bin"),
+        os.path.join(os.environ.get("LOCALAPPDATA", "C:\\Users\\Default\\AppData\\Local"), "Programs", "LLVM", "bin"),
+    ),
+}
+
+
+def _clangd_cache_file() -> str:
+    """
+    Returns the path of the on-disk cache recording the last resolved clangd executable.
+    """
+    return os.path.join(MultilspySettings.get_global_cache_directory(), "clangd_path.json")
+
+
+def _read_clangd_cache() -> dict:
+    """
+    Reads the on-disk clangd cache, returning an empty dict if it is missing or corrupt.
+    """
+    try:
+        with open(_clangd_cache_file(), "r") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_clangd_cache(cache: dict) -> None:
+    """
+    Atomically replaces the on-disk clangd cache with the given contents.
+    """
+    cache_file = _clangd_cache_file()
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), prefix=".clangd_path.", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # The cache is an optimization only; failing to write it must not break server setup
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _path_env_hash() -> str:
+    """
+    Returns a hash of the PATH environment variable, used to invalidate the clangd cache.
+    """
+    return hashlib.sha1(os.environ.get("PATH", "").encode("utf-8")).hexdigest()
+
+
+def _resolve_clangd_cached(platform_id: str, path_env_hash: str) -> Optional[str]:
+    """
+    Returns the cached clangd executable path if the cache entry was recorded for the same platform and PATH,
+    and the executable has not been modified since. Validation is a single stat call; clangd is not executed.
+    """
+    cache = _read_clangd_cache()
+    if cache.get("platform_id") != platform_id or cache.get("path_env_sha1") != path_env_hash:
+        return None
+
+    path = cache.get("path")
+    if not path:
+        return None
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    if st.st_mtime != cache.get("mtime"):
+        return None
+
+    return path
+
+
+def _store_clangd_cached(platform_id: str, path_env_hash: str, path: str) -> None:
+    """
+    Records the resolved clangd executable path in the on-disk cache.
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return
+
+    cache = _read_clangd_cache()
+    cache.update({"platform_id": platform_id, "path_env_sha1": path_env_hash, "path": path, "mtime": mtime})
+    _write_clangd_cache(cache)
+
+
+def _is_valid_executable(path: str) -> bool:
+    """
+    Returns whether the given path exists and has any execute permission bit set, using a single stat call.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return bool(st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+
+
+def _ensure_executable(path: str, st: os.stat_result) -> None:
+    """
+    Adds the execute permission to a freshly downloaded binary, since archive extraction does not preserve it.
+    """
+    if not st.st_mode & stat.S_IXUSR:
+        os.chmod(path, st.st_mode | stat.S_IEXEC)
+
+
+def _locate_clangd(logger: MultilspyLogger, platform_id: PlatformId) -> str:
+    """
+    Searches for a clangd executable, prioritizing local installations before attempting to download.
+
+    Search order:
+    1. PATH environment
+    2. Common installation directories based on platform (searched together with PATH by shutil.which)
+    3. IDE bundled installations
+    4. Download from specified URL if no local installation found
+
+    Returns:
+        str: Path to the clangd executable
+    """
+    # Helper function to verify clangd version. Spawning clangd is expensive, so this is only
+    # used as an integrity check on freshly downloaded binaries.
+    def verify_clangd_version(path):
+        try:
+            # Only the exit status matters, so the output is discarded instead of piped and decoded
+            result = subprocess.run(
+                [path, "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+            )
+            if result.returncode == 0:
+                logger.log(f"Verified clangd at {path}", logging.INFO)
+                return True
+            return False
+        except Exception as e:
+            logger.log(f"Error verifying clangd version: {str(e)}", logging.INFO)
+            return False
+
+    # 1+2. Search PATH followed by the platform-specific common installation directories with a single
+    # shutil.which call. Anything found there is trusted as is.
+    common_dirs = _COMMON_DIRS.get(platform_id.value.split("-")[0], ())
+    path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+    extra_dirs = [directory for directory in common_dirs if directory not in path_dirs]
+    try:
+        clangd_path = shutil.which("clangd", path=os.pathsep.join(path_dirs + extra_dirs))
+    except Exception as e:
+        logger.log(f"Error checking for clangd in PATH: {str(e)}", logging.INFO)
+        clangd_path = None
+
+    if clangd_path is not None:
+        if os.path.dirname(clangd_path) in extra_dirs:
+            logger.log(f"Found clangd at common location: {clangd_path}", logging.INFO)
+        else:
+            logger.log(f"Found system clangd in PATH: {clangd_path}", logging.INFO)
+        return clangd_path
+
+    # 3. Check for bundled clangd
+    clangd_ls_dir = os.path.join(os.path.dirname(__file__), "static", "Clangd")
+
+    # Look up the runtime dependency for this platform
+    try:
+        dependency = _RUNTIME_DEPS.get(platform_id.value)
+        if dependency is None:
+            logger.log(f"No runtime dependencies found for platform {platform_id.value}", logging.ERROR)
+            raise Exception(f"No runtime dependencies found for platform {platform_id.value}")
+
+        clangd_executable_path = os.path.join(clangd_ls_dir, dependency["binaryName"])
+
+        # Check if we already have the executable
+        if _is_valid_executable(clangd_executable_path):
+            logger.log(f"Using existing bundled clangd at {clangd_executable_path}", logging.INFO)
+            return clangd_executable_path
+
+        # 4. Download and extract clangd as last resort
+        logger.log(f"No local clangd installation found. Downloading from {dependency['url']}", logging.INFO)
+
+        if not os.path.exists(clangd_ls_dir):
+            os.makedirs(clangd_ls_dir)
+
+        try:
+            if dependency["archiveType"] == "gz":
+                # A gz dependency is the executable itself, streamed and decompressed in place
+                FileUtils.download_and_extract_archive(
+                    logger, dependency["url"], clangd_executable_path, dependency["archiveType"]
+                )
+            else:
+                FileUtils.download_and_extract_archive(
+                    logger, dependency["url"], clangd_ls_dir, dependency["archiveType"]
+                )
+
+            try:
+                _ensure_executable(clangd_executable_path, os.stat(clangd_executable_path))
+            except OSError as e:
+                logger.log(f"Downloaded clangd is not executable: {clangd_executable_path}: {str(e)}", logging.ERROR)
+                raise Exception(f"Downloaded clangd is not executable: {clangd_executable_path}")
+
+            if not verify_clangd_version(clangd_executable_path):
+                logger.log(f"Downloaded clangd failed version verification: {clangd_executable_path}", logging.ERROR)
+                raise Exception(f"Downloaded clangd failed version verification: {clangd_executable_path}")
+
+            logger.log(f"Successfully downloaded and set up clangd at {clangd_executable_path}", logging.INFO)
+            return clangd_executable_path
+
+        except Exception as e:
+            logger.log(f"Error downloading clangd: {str(e)}", logging.ERROR)
+            raise Exception(f"Failed to find or download clangd: {str(e)}")
+
+    except Exception as e:
+        logger.log(f"Error setting up clangd: {str(e)}", logging.ERROR)
+        raise Exception(f"Failed to set up clangd: {str(e)}")
+
+
+_resolver_context = threading.local()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_clangd(platform_value: str) -> str:
+    """
+    Resolves the clangd executable for the given platform, consulting the on-disk cache before searching.
+    Memoized for the lifetime of the process, so repeated ClangdServer instantiations resolve clangd only once.
+    The logger is taken from _resolver_context since it cannot be part of the cache key.
+    """
+    logger = _resolver_context.logger
+    path_env_hash = _path_env_hash()
+
+    cached_clangd_path = _resolve_clangd_cached(platform_value, path_env_hash)
+    if cached_clangd_path is not None:
+        logger.log(f"Using cached clangd at {cached_clangd_path}", logging.INFO)
+        return cached_clangd_path
+
+    clangd_executable_path = _locate_clangd(logger, PlatformId(platform_value))
+    _store_clangd_cached(platform_value, path_env_hash, clangd_executable_path)
+    return clangd_executable_path
+
+
+def _get_clangd_executable_path(logger: MultilspyLogger) -> str:
+    """
+    Returns the clangd executable for the current platform, passing the logger to _resolve_clangd.
+    """
+    _resolver_context.logger = logger
+    try:
+        return _resolve_clangd(PlatformUtils.get_platform_id().value)
+    finally:
+        del _resolver_context.logger
+
+
+# Pooled ClangdServer instances keyed by (clangd executable path, repository root path, config fields, logger id),
+# least recently acquired first. See ClangdServer.acquire; at most _SESSION_POOL_SIZE instances are kept.
+_SESSION_POOL_SIZE = 8
+_SESSION_POOL: "OrderedDict[Tuple[str, str, tuple, int], ClangdServer]" = OrderedDict()
+
+
+def _kill_process(process: Optional[asyncio.subprocess.Process]) -> None:
+    """
+    Kills a language server process that will not be shut down through the LSP shutdown sequence, along with its children
+    """
+    if process is None or process.returncode is not None:
+        return
+    try:
+        for child in psutil.Process(process.pid).children(recursive=True):
+            child.kill()
+        process.kill()
+    except (ProcessLookupError, psutil.NoSuchProcess):
+        pass
 
 
 class ClangdServer(LanguageServer):
@@ -25,6 +337,40 @@ class ClangdServer(LanguageServer):
     Provides C/C++ specific instantiation of the LanguageServer class. Contains various configurations and settings specific to C/C++.
     """
 
+    # Seconds a clangd session is kept alive after the last start_server scope using it exits, so that a following
+    # scope on the same event loop reuses it. With the default of 0 the session is shut down on scope exit, as for
+    # other language servers. Only use a timeout with event loops that keep running after the scope exits; the loop
+    # of SyncLanguageServer is stopped right away, so the idle shutdown would never run.
+    session_idle_timeout: float = 0
+
+    @classmethod
+    def acquire(cls, config: MultilspyConfig, logger: MultilspyLogger, repository_root_path: str) -> "ClangdServer":
+        """
+        Returns the pooled ClangdServer for the given repository, config and logger, creating it on first use.
+        Entering start_server on a pooled instance while its clangd session is running reuses that session instead
+        of spawning clangd again.
+        A pooled instance whose session is in use on another event loop is replaced by a new instance.
+        """
+        # The pooled instance holds the logger, so its id cannot be reused by another logger while it is pooled
+        key = (
+            _get_clangd_executable_path(logger),
+            os.path.abspath(repository_root_path),
+            dataclasses.astuple(config),
+            id(logger),
+        )
+        server = _SESSION_POOL.get(key)
+        if server is None or server._in_use_on_other_loop():
+            server = cls(config, logger, repository_root_path)
+            _SESSION_POOL[key] = server
+        _SESSION_POOL.move_to_end(key)
+        while len(_SESSION_POOL) > _SESSION_POOL_SIZE:
+            _, evicted = _SESSION_POOL.popitem(last=False)
+            # Nothing can reuse the idle session of an evicted instance, so its clangd process is killed now.
+            # An evicted instance still in use shuts its session down when its last scope exits.
+            if evicted._session_refcount == 0:
+                evicted._abandon_session()
+        return server
+
     def __init__(self, config: MultilspyConfig, logger: MultilspyLogger, repository_root_path: str):
         """
         Creates a ClangdServer instance. This class is not meant to be instantiated directly. Use LanguageServer.create() instead.
@@ -39,178 +385,49 @@ class ClangdServer(LanguageServer):
         )
         self.server_ready = asyncio.Event()
 
+        # State of the clangd session shared by nested or repeated start_server scopes
+        self._session_stack: Optional[AsyncExitStack] = None
+        self._session_refcount = 0
+        self._session_generation = 0
+        self._idle_shutdown_task: Optional[asyncio.Future] = None
+        # Event loop the session runs on, and the lock serializing its start and stop on that loop
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+
+        # Register handlers for clangd notifications and requests once, so they stay stable across sessions
+        self.server.on_notification("window/logMessage", self._window_log_message)
+        self.server.on_notification("textDocument/publishDiagnostics", self._do_nothing)
+        self.server.on_notification("$/progress", self._do_nothing)
+
+    async def _window_log_message(self, msg):
+        self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+
+    async def _do_nothing(self, params):
+        return
+
     def setup_runtime_dependencies(self, logger: MultilspyLogger, config: MultilspyConfig) -> str:
         """
         Setup runtime dependencies for clangd.
-        Prioritizes finding local installations before attempting to download.
-        
-        Search order:
-        1. PATH environment (using shutil.which)
-        2. Common installation locations based on platform
-        3. IDE bundled installations
-        4. Download from specified URL if no local installation found
-        
+        The resolved path is memoized per process and cached on disk (keyed by platform and PATH),
+        so the search in _locate_clangd only runs when both caches miss.
+
         Returns:
             str: Path to the clangd executable
         """
-        # Helper function to check if an executable exists and is valid
-        def is_valid_executable(path):
-            if not os.path.exists(path):
-                return False
-            
-            if not os.access(path, os.X_OK):
-                try:
-                    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
-                except Exception:
-                    return False
-            
-            return True
-        
-        # Helper function to verify clangd version
-        def verify_clangd_version(path):
-            try:
-                import subprocess
-                result = subprocess.run([path, "--version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    version_info = result.stdout
-                    logger.log(f"Found clangd version: {version_info.strip()}", logging.INFO)
-                    return True
-                return False
-            except Exception as e:
-                logger.log(f"Error verifying clangd version: {str(e)}", logging.INFO)
-                return False
-        
-        # 1. First, check if clangd is in PATH
-        try:
-            import shutil
-            system_clangd_path = shutil.which("clangd")
-            if system_clangd_path and verify_clangd_version(system_clangd_path):
-                logger.log(f"Found system clangd in PATH: {system_clangd_path}", logging.INFO)
-                return system_clangd_path
-        except Exception as e:
-            logger.log(f"Error checking for clangd in PATH: {str(e)}", logging.INFO)
-        
-        # 2. Check platform-specific common installation locations
-        platform_id = PlatformUtils.get_platform_id()
-        common_paths = []
-        
-        if platform_id.value.startswith("osx"):
-            # macOS paths
-            common_paths = [
-                "/opt/homebrew/bin/clangd",
-                "/usr/local/bin/clangd",
-                "/usr/bin/clangd",
-                "/Applications/Xcode.app/Contents/Developer/Toolchains/XcodeDefault.xctoolchain/usr/bin/clangd",
-                os.path.expanduser("~/Library/Application Support/Code/User/globalStorage/llvm-vs-code-extensions.vscode-clangd/install/clangd_16/bin/clangd")
-            ]
-        elif platform_id.value.startswith("linux"):
-            # Linux paths
-            common_paths = [
-                "/usr/bin/clangd",
-                "/usr/local/bin/clangd",
-                "/snap/bin/clangd",
-                "/opt/clangd/bin/clangd",
-                os.path.expanduser("~/.local/bin/clangd"),
-                os.path.expanduser("~/.vscode/extensions/llvm-vs-code-extensions.vscode-clangd/install/clangd_16/bin/clangd")
-            ]
-        elif platform_id.value.startswith("win"):
-            # Windows paths
-            program_files = os.environ.get("ProgramFiles", "C:\\Program Files")
-            program_files_x86 = os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)")
-            common_paths = [
-                os.path.join(program_files, "LLVM", "bin", "clangd.exe"),
-                os.path.join(program_files_x86, "LLVM", "bin", "clangd.exe"),
-                os.path.join(os.environ.get("USERPROFILE", "C:\\Users\\Default"), ".vscode", "extensions", "llvm-vs-code-extensions.vscode-clangd", "install", "clangd_16", "bin", "clangd.exe"),
-                os.path.join(os.environ.get("LOCALAPPDATA", "C:\\Users\\Default\\AppData\\Local"), "Programs", "LLVM", "bin", "clangd.exe")
-            ]
-        
-        # Check all common paths
-        for path in common_paths:
-            if is_valid_executable(path) and verify_clangd_version(path):
-                logger.log(f"Found clangd at common location: {path}", logging.INFO)
-                return path
-        
-        # 3. Check for bundled clangd
-        clangd_ls_dir = os.path.join(os.path.dirname(__file__), "static", "Clangd")
-        
-        # Load runtime dependencies
-        try:
-            with open(os.path.join(os.path.dirname(__file__), "runtime_dependencies.json"), "r") as f:
-                d = json.load(f)
-                del d["_description"]
-
-            runtime_dependencies = d["runtimeDependencies"]
-            runtime_dependencies = [
-                dependency for dependency in runtime_dependencies if dependency["platformId"] == platform_id.value
-            ]
-            
-            if not runtime_dependencies:
-                logger.log(f"No runtime dependencies found for platform {platform_id.value}", logging.ERROR)
-                raise Exception(f"No runtime dependencies found for platform {platform_id.value}")
-                
-            dependency = runtime_dependencies[0]
-            clangd_executable_path = os.path.join(clangd_ls_dir, dependency["binaryName"])
-            
-            # Check if we already have the executable
-            if is_valid_executable(clangd_executable_path) and verify_clangd_version(clangd_executable_path):
-                logger.log(f"Using existing bundled clangd at {clangd_executable_path}", logging.INFO)
-                return clangd_executable_path
-                
-            # 4. Download and extract clangd as last resort
-            logger.log(f"No local clangd installation found. Downloading from {dependency['url']}", logging.INFO)
-            
-            if not os.path.exists(clangd_ls_dir):
-                os.makedirs(clangd_ls_dir)
-                
-            try:
-                if dependency["archiveType"] == "gz":
-                    FileUtils.download_and_extract_archive(
-                        logger, dependency["url"], clangd_executable_path, dependency["archiveType"]
-                    )
-                else:
-                    FileUtils.download_and_extract_archive(
-                        logger, dependency["url"], clangd_ls_dir, dependency["archiveType"]
-                    )
-                    
-                if not is_valid_executable(clangd_executable_path):
-                    logger.log(f"Downloaded clangd is not executable: {clangd_executable_path}", logging.ERROR)
-                    raise Exception(f"Downloaded clangd is not executable: {clangd_executable_path}")
-                
-                if not verify_clangd_version(clangd_executable_path):
-                    logger.log(f"Downloaded clangd failed version verification: {clangd_executable_path}", logging.ERROR)
-                    raise Exception(f"Downloaded clangd failed version verification: {clangd_executable_path}")
-                
-                logger.log(f"Successfully downloaded and set up clangd at {clangd_executable_path}", logging.INFO)
-                return clangd_executable_path
-                
-            except Exception as e:
-                logger.log(f"Error downloading clangd: {str(e)}", logging.ERROR)
-                raise Exception(f"Failed to find or download clangd: {str(e)}")
-                
-        except Exception as e:
-            logger.log(f"Error setting up clangd: {str(e)}", logging.ERROR)
-            raise Exception(f"Failed to set up clangd: {str(e)}")
+        return _get_clangd_executable_path(logger)
 
     def _get_initialize_params(self, repository_absolute_path: str) -> InitializeParams:
         """
         Returns the initialize params for the Clangd Language Server.
         """
-        with open(os.path.join(os.path.dirname(__file__), "initialize_params.json"), "r") as f:
-            d = json.load(f)
-
-        del d["_description"]
+        d = copy.deepcopy(_INIT_PARAMS_TEMPLATE)
 
         d["processId"] = os.getpid()
-        assert d["rootPath"] == "$rootPath"
         d["rootPath"] = repository_absolute_path
 
-        assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["name"] == "$name"
+        root_uri = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = root_uri
+        d["workspaceFolders"][0]["uri"] = root_uri
         d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
 
         return d
@@ -219,6 +436,8 @@ class ClangdServer(LanguageServer):
     async def start_server(self) -> AsyncIterator["ClangdServer"]:
         """
         Starts the Clangd Language Server, waits for the server to be ready and yields the LanguageServer instance.
+        If a clangd session of this instance is already running (see ClangdServer.acquire), it is reused and only
+        shut down once the last user exits, after session_idle_timeout seconds.
 
         Usage:
         ```
@@ -229,40 +448,151 @@ class ClangdServer(LanguageServer):
             # Shutdown the LanguageServer on exit from scope
         # LanguageServer has been shutdown
         """
+        loop = asyncio.get_running_loop()
+        self._bind_session_loop(loop)
+        async with self._session_lock:
+            if self._session_stack is None:
+                await self._start_session()
+            self._session_refcount += 1
+            self._session_generation += 1
 
-        async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+        failed = False
+        try:
+            yield self
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            async with self._session_lock:
+                self._session_refcount -= 1
+                if self._session_refcount == 0:
+                    # A scope that failed may have left clangd in a bad state, so its session is not kept for reuse
+                    if failed or self.session_idle_timeout <= 0:
+                        await self._stop_session()
+                    else:
+                        self._idle_shutdown_task = loop.create_task(
+                            self._stop_session_when_idle(self._session_generation)
+                        )
+
+    def _in_use_on_other_loop(self) -> bool:
+        """
+        Returns True if the clangd session is held by a start_server scope on an event loop other than the running one.
+        """
+        if self._session_refcount == 0:
+            return False
+        try:
+            return asyncio.get_running_loop() is not self._session_loop
+        except RuntimeError:
+            return True
+
+    def _bind_session_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Prepares the session state for use on the given event loop. asyncio primitives and the clangd pipes belong to
+        the loop they were created on, so an idle session left behind on another loop (e.g. by SyncLanguageServer,
+        which runs each start_server scope on a new loop) is abandoned and its process killed.
+        """
+        if self._session_loop is loop:
+            return
+        if self._session_refcount > 0:
+            raise MultilspyException("The clangd session is in use on another event loop")
+        self._abandon_session()
+        self._session_loop = loop
+        self._session_lock = asyncio.Lock()
+        self.server_ready = asyncio.Event()
+        self.completions_available = asyncio.Event()
 
-        async def do_nothing(params):
+    def _abandon_session(self) -> None:
+        """
+        Drops an idle clangd session without the LSP shutdown sequence, which needs the event loop the session runs
+        on, killing the clangd process and cancelling the tasks left on that loop.
+        """
+        if self._session_stack is None:
             return
+        self.logger.log("Abandoning idle clangd session", logging.INFO)
+        _kill_process(self.server.process)
+        pending_tasks = list(self.server.tasks.values())
+        if self._idle_shutdown_task is not None:
+            pending_tasks.append(self._idle_shutdown_task)
+        for task in pending_tasks:
+            try:
+                task.cancel()
+            except RuntimeError:
+                # The loop of the task is closed, so it can never run again anyway
+                pass
+        # Reset the per-session state of the LSP handler; the registered notification handlers are kept
+        self.server.process = None
+        self.server.tasks = {}
+        self.server.loop = None
+        self.server.request_id = 1
+        self.server._response_handlers = {}
+        self.server._received_shutdown = False
+        self._session_stack = None
+        self._idle_shutdown_task = None
+        self.completions_available.clear()
+        self.server_ready.clear()
+        self.server_started = False
 
-        # Register handlers for clangd notifications and requests
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-        self.server.on_notification("$/progress", do_nothing)
+    async def _start_session(self) -> None:
+        """
+        Starts the clangd process and performs the LSP initialization handshake. If any step fails, the process is
+        killed and everything entered so far is unwound before the exception propagates.
+        """
+        session_stack = AsyncExitStack()
+        try:
+            await session_stack.enter_async_context(super().start_server())
+
+            # The initialize params do not depend on the process, so they are ready before it is spawned
+            initialize_params = self._get_initialize_params(self.repository_root_path)
 
-        async with super().start_server():
             self.logger.log("Starting Clangd server process", logging.INFO)
             await self.server.start()
-            initialize_params = self._get_initialize_params(self.repository_root_path)
 
             self.logger.log(
                 "Sending initialize request from LSP client to LSP server and awaiting response",
                 logging.INFO,
             )
             init_response = await self.server.send.initialize(initialize_params)
-            
+
             # Check server capabilities
             assert init_response["capabilities"]["textDocumentSync"]["change"] == 2
             assert "completionProvider" in init_response["capabilities"]
-            
+
             self.server.notify.initialized({})
-            self.completions_available.set()
-            
-            # Set server ready
-            self.server_ready.set()
+        except BaseException:
+            _kill_process(self.server.process)
+            await self.server.stop()
+            await session_stack.aclose()
+            raise
 
-            yield self
+        self.completions_available.set()
 
-            await self.server.shutdown()
-            await self.server.stop()
+        # Set server ready
+        self.server_ready.set()
+        self._session_stack = session_stack
+
+    async def _stop_session(self) -> None:
+        """
+        Shuts down the running clangd session.
+        """
+        session_stack = self._session_stack
+        if session_stack is None:
+            return
+        self._session_stack = None
+
+        await self.server.shutdown()
+        await self.server.stop()
+        self.completions_available.clear()
+        self.server_ready.clear()
+        await session_stack.aclose()
+
+    async def _stop_session_when_idle(self, generation: int) -> None:
+        """
+        Shuts down the clangd session after session_idle_timeout seconds, unless it was reacquired in the meantime.
+        The session is also shut down if the wait is cancelled, e.g. by asyncio.run cancelling pending tasks on exit.
+        """
+        try:
+            await asyncio.sleep(self.session_idle_timeout)
+        finally:
+            async with self._session_lock:
+                if self._session_refcount == 0 and self._session_generation == generation:
+                    await self._stop_session()
@@ -2,21 +2,279 @@
 Provides Python specific instantiation of the LanguageServer class. Contains various configurations and settings specific to Python.
 """
 
-import json
+import asyncio
+import bisect
+import copy
+import dataclasses
+import functools
+import hashlib
 import logging
 import os
 import pathlib
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, List, Tuple, Union
+import pickle
+import re
+import sqlite3
+import traceback
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 from pathlib import Path
 
 from multilspy.multilspy_logger import MultilspyLogger
-from multilspy.language_server import LanguageServer
+from multilspy.language_server import LanguageServer, LSPFileBuffer
 from multilspy.lsp_protocol_handler.server import ProcessLaunchInfo
 from multilspy.lsp_protocol_handler.lsp_types import InitializeParams
 from multilspy.multilspy_config import MultilspyConfig
+from multilspy.multilspy_settings import MultilspySettings
+from multilspy.multilspy_utils import FileUtils
 from multilspy import multilspy_types
 
+# Jedi is not thread-safe, so all Jedi work in the process is serialized on a single worker thread
+_JEDI_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jedi")
+
+R = TypeVar("R")
+
+# Map Jedi types to LSP symbol kinds
+_JEDI_TYPE_TO_SYMBOL_KIND = {
+    "module": multilspy_types.SymbolKind.Module,
+    "class": multilspy_types.SymbolKind.Class,
+    "function": multilspy_types.SymbolKind.Function,
+    "statement": multilspy_types.SymbolKind.Variable,
+    "instance": multilspy_types.SymbolKind.Variable,
+    "param": multilspy_types.SymbolKind.Variable,
+    "import": multilspy_types.SymbolKind.Module,
+    "property": multilspy_types.SymbolKind.Property,
+    "method": multilspy_types.SymbolKind.Method,
+    "keyword": multilspy_types.SymbolKind.Constant,
+}
+
+# Map Jedi completion types to LSP completion item kinds
+_JEDI_TYPE_TO_COMPLETION_KIND = {
+    "module": multilspy_types.CompletionItemKind.Module,
+    "class": multilspy_types.CompletionItemKind.Class,
+    "function": multilspy_types.CompletionItemKind.Function,
+    "instance": multilspy_types.CompletionItemKind.Variable,
+    "statement": multilspy_types.CompletionItemKind.Variable,
+    "param": multilspy_types.CompletionItemKind.Variable,
+    "import": multilspy_types.CompletionItemKind.Module,
+    "property": multilspy_types.CompletionItemKind.Property,
+    "method": multilspy_types.CompletionItemKind.Method,
+    "keyword": multilspy_types.CompletionItemKind.Keyword,
+}
+
+# Wraps hover text in a python markdown code block
+_HOVER_CODE_FENCE = "```python\n{}\n```".format
+
+# Text before the cursor after which Jedi never offers completions: a closing bracket or a number literal
+_NO_COMPLETION_PREFIX = re.compile(r"(?:[)\]}]|(?<![\w.])\d\w*)$")
+
+
+def _cannot_complete_after(prefix: str) -> bool:
+    """
+    Returns True if Jedi is known to return no completions for a cursor placed after the given line prefix.
+    Prefixes containing comments or string quotes are never short-circuited, since Jedi treats those differently.
+    """
+    if "#" in prefix or "'" in prefix or '"' in prefix:
+        return False
+    return _NO_COMPLETION_PREFIX.search(prefix) is not None
+
+
+@dataclasses.dataclass
+class _CachedScript:
+    """
+    A parsed Jedi Script together with the data derived from it, valid while its source is unchanged.
+    """
+
+    # st_mtime_ns of the file when it was read, or -1 if the source came from an open buffer
+    mtime_ns: int
+
+    # st_size of the file when it was read, or -1 if the source came from an open buffer
+    size: int
+
+    # The source text the Script was built from (the same str object the Script holds, not a copy)
+    code: str
+
+    # The jedi.Script object
+    script: Any
+
+    # SHA-256 of the file's bytes, or None if the source came from an open buffer
+    sha: Optional[bytes] = None
+
+    # The open buffer the source came from and its version at the time, if any
+    buffer: Optional[LSPFileBuffer] = None
+    buffer_version: Optional[int] = None
+
+    # Result of script.get_names(all_scopes=True, definitions=True), computed on first use
+    names: Optional[List[Any]] = None
+
+    # The same names grouped by their 1-based line number, each group sorted by column
+    names_by_line: Optional[Dict[int, List[Any]]] = None
+
+    # The start columns of each group in names_by_line, for bisection
+    columns_by_line: Optional[Dict[int, List[int]]] = None
+
+    # Offsets in code at which each line starts, computed on first use
+    line_offsets: Optional[List[int]] = None
+
+    def get_names(self) -> Tuple[List[Any], Dict[int, List[Any]]]:
+        """
+        Returns all names defined in the file and the names indexed by line, computing them once per Script.
+        """
+        if self.names is None:
+            names = self.script.get_names(all_scopes=True, definitions=True)
+            names_by_line = defaultdict(list)
+            for name in names:
+                names_by_line[name.line].append(name)
+            for line_names in names_by_line.values():
+                line_names.sort(key=lambda n: n.column)
+            self.columns_by_line = {line: [n.column for n in line_names] for line, line_names in names_by_line.items()}
+            self.names, self.names_by_line = names, dict(names_by_line)
+        return self.names, self.names_by_line
+
+    def names_near(self, line: int, column: int, margin: int = 5) -> List[Any]:
+        """
+        Returns the names on the given 1-based line that the column falls within, allowing a margin around each name
+        """
+        _, names_by_line = self.get_names()
+        line_names = names_by_line.get(line)
+        if not line_names:
+            return []
+        # Only names starting at or before column + margin can match; bisect to skip the rest of the line
+        end = bisect.bisect_right(self.columns_by_line[line], column + margin)
+        return [name for name in line_names[:end] if column <= name.column + len(name.name) + margin]
+
+    def get_line(self, line: int) -> Optional[str]:
+        """
+        Returns the text of the given 0-based line without its line break, or None if the file is shorter
+        """
+        offsets = self.line_offsets
+        if offsets is None:
+            code = self.code
+            offsets = [0]
+            i = code.find('\n')
+            while i >= 0:
+                offsets.append(i + 1)
+                i = code.find('\n', i + 1)
+            self.line_offsets = offsets
+        if line >= len(offsets) or (line == len(offsets) - 1 and offsets[line] == len(self.code)):
+            return None
+        end = offsets[line + 1] - 1 if line + 1 < len(offsets) else len(self.code)
+        return self.code[offsets[line]:end]
+
+# Directories never searched for Python sources: VCS metadata, caches, virtualenvs, vendored JS and build output
+_PRUNE = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', '.mypy_cache', '.pytest_cache', '.tox',
+    'dist', 'build', '.idea', '.vscode',
+})
+
+
+class _PersistentParseCache:
+    """
+    Per-repository SQLite store of pickled parso module trees, keyed by file path, the hash of the grammar the tree
+    was parsed with and the parso version that built it, and validated by the SHA-256 of its source.
+    Seeding parso's in-memory parser cache from it lets Jedi skip parsing files that are unchanged since a previous session.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        # The parser cache and its item type are parso internals; if they change, the persistent cache is not opened
+        import parso
+        from parso.cache import parser_cache, _NodeCacheItem
+
+        self._parser_cache = parser_cache
+        self._node_cache_item = _NodeCacheItem
+        self._parso_version = parso.__version__
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # All Jedi work runs on the Jedi worker thread, but the connection is opened and closed by start_server
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS parse_trees("
+            "path TEXT, hashed_grammar TEXT, parso_version TEXT, sha BLOB, blob BLOB, "
+            "PRIMARY KEY (path, hashed_grammar, parso_version))"
+        )
+        # Trees pickled by another parso version can never be loaded again
+        self.connection.execute("DELETE FROM parse_trees WHERE parso_version != ?", (self._parso_version,))
+        self.connection.commit()
+
+    def seed(self, hashed_grammar: str, path: Path, code: str, sha: bytes) -> bool:
+        """
+        Places the stored tree for path into parso's parser cache if it was built with the same grammar and parso
+        version from the same source. Returns True if parso will reuse it.
+        """
+        from parso.utils import split_lines
+
+        module_cache = self._parser_cache.setdefault(hashed_grammar, {})
+        if path in module_cache:
+            # parso already holds a tree for this path in memory and diffs against it
+            return False
+        row = self.connection.execute(
+            "SELECT sha, blob FROM parse_trees WHERE path = ? AND hashed_grammar = ? AND parso_version = ?",
+            (str(path), hashed_grammar, self._parso_version),
+        ).fetchone()
+        if row is None or row[0] != sha:
+            return False
+        module_cache[path] = self._node_cache_item(pickle.loads(row[1]), split_lines(code, keepends=True))
+        return True
+
+    def store(self, hashed_grammar: str, path: Path, sha: bytes) -> None:
+        """
+        Saves the tree parso currently caches for path under the given grammar, recording the SHA-256 of the source
+        it was built from
+        """
+        item = self._parser_cache.get(hashed_grammar, {}).get(path)
+        if item is None:
+            return
+        blob = pickle.dumps(item.node, pickle.HIGHEST_PROTOCOL)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO parse_trees(path, hashed_grammar, parso_version, sha, blob) VALUES (?, ?, ?, ?, ?)",
+            (str(path), hashed_grammar, self._parso_version, sha, blob),
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Closes the database connection
+        """
+        self.connection.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _initialize_params_template() -> dict:
+    """
+    Returns the parsed initialize_params.json with its placeholders checked, loading it on first use only
+    """
+    d = FileUtils.read_json(str(pathlib.Path(__file__).with_name("initialize_params.json")))
+
+    del d["_description"]
+
+    assert d["rootPath"] == "$rootPath"
+    assert d["rootUri"] == "$rootUri"
+    assert d["workspaceFolders"][0]["uri"] == "$uri"
+    assert d["workspaceFolders"][0]["name"] == "$name"
+
+    return d
+
+
+def _dir_has_python(path: str) -> bool:
+    """
+    Returns True as soon as a .py file is found anywhere under the given directory.
+    Uses an explicit os.scandir stack, so only directory listings are read and no per-file stat calls are made.
+    Subdirectories named in _PRUNE are not descended into.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.py'):
+                        return True
+                    if entry.name not in _PRUNE and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
 
 class JediServer(LanguageServer):
     """
@@ -47,6 +305,7 @@ class JediServer(LanguageServer):
         
         # Add additional paths that might contain Python modules
         additional_paths = [repository_root_path]
+        seen_paths = {repository_root_path}
         
         # First add standard directories if they exist
         standard_dirs = ["tests", "src", "examples", "performance", "benchmarks", "docs"]
@@ -55,34 +314,32 @@ class JediServer(LanguageServer):
             if os.path.isdir(dir_path):
                 logger.log(f"{dir_name.capitalize()} directory exists: {dir_path}", logging.INFO)
                 additional_paths.append(dir_path)
+                seen_paths.add(dir_path)
         
         # Then scan all top-level directories for Python content
-        for item in os.listdir(repository_root_path):
-            item_path = os.path.join(repository_root_path, item)
-            
-            # Skip if not a directory or already added
-            if not os.path.isdir(item_path) or item_path in additional_paths:
-                continue
+        with os.scandir(repository_root_path) as entries:
+            for entry in entries:
+                item_path = entry.path
                 
-            # Check if directory contains Python files
-            has_python_files = False
-            for root, _, files in os.walk(item_path, topdown=True, followlinks=False):
-                if any(f.endswith('.py') for f in files):
-                    has_python_files = True
-                    break
+                # Skip if pruned, not a directory or already added
+                if entry.name in _PRUNE or item_path in seen_paths or not entry.is_dir():
+                    continue
                     
-            if has_python_files:
-                logger.log(f"Found directory with Python files: {item_path}", logging.INFO)
-                additional_paths.append(item_path)
+                # Check if directory contains Python files
+                if _dir_has_python(item_path):
+                    logger.log(f"Found directory with Python files: {item_path}", logging.INFO)
+                    additional_paths.append(item_path)
+                    seen_paths.add(item_path)
         
-        # Add any Python package directories inside src (if it exists)
+        # Add any Python package directories inside src (if it was found among the standard directories)
         src_path = os.path.join(repository_root_path, "src")
-        if os.path.isdir(src_path):
-            for item in os.listdir(src_path):
-                item_path = os.path.join(src_path, item)
-                if os.path.isdir(item_path) and os.path.exists(os.path.join(item_path, "__init__.py")):
-                    logger.log(f"Found Python package: {item_path}", logging.INFO)
-                    additional_paths.append(item_path)
+        if src_path in seen_paths:
+            with os.scandir(src_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        logger.log(f"Found Python package: {entry.path}", logging.INFO)
+                        additional_paths.append(entry.path)
+                        seen_paths.add(entry.path)
         
         # Print the additional paths for debugging
         logger.log("\nAdditional paths added to Jedi:", logging.INFO)
@@ -97,7 +354,267 @@ class JediServer(LanguageServer):
         
         logger.log(f"Project path: {self.project.path}", logging.INFO)
         logger.log(f"Added sys paths: {additional_paths}", logging.INFO)
+
+        # Jedi Script objects keyed by absolute path, in least-recently-used order, bounded by the configured size
+        self._script_cache: "OrderedDict[str, _CachedScript]" = OrderedDict()
+        self._script_cache_size = max(1, config.jedi_script_cache_size)
+
+        # (uri, relative path) pairs keyed by module path, shared by all location conversions
+        self._uri_cache: Dict[str, Tuple[str, str]] = {}
+
+        # In-flight Jedi requests keyed by operation, arguments and buffer version, for coalescing duplicates
+        self._pending_requests: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+
+        # (absolute path, buffer, contents, version) of the open file the current Jedi operation is for, taken
+        # on the event loop when the operation was submitted; only read and written on the Jedi worker thread
+        self._buffer_snapshot: Optional[Tuple[str, LSPFileBuffer, str, int]] = None
+
+        # Parse trees persisted across sessions, opened by the outermost start_server scope and closed when it exits
+        self._parse_cache: Optional[_PersistentParseCache] = None
+        self._server_scopes = 0
+        self._hashed_grammar: Optional[str] = None
+
+        # Per-repository directory for parso's pickled parse trees, created by start_server
+        self._parso_cache_directory: Optional[str] = None
+
+    async def _run_in_jedi_thread(self, func: Callable[..., R], relative_file_path: str, *args: Any) -> R:
+        """
+        Runs a synchronous Jedi operation on the shared Jedi worker thread, so the event loop stays responsive.
+        Identical requests issued while one is still pending share its result instead of being queued again.
+        """
+        # The buffer version distinguishes requests made before and after an edit to an open file
+        file_buffer = None
+        if self.open_file_buffers:
+            file_buffer = self.open_file_buffers.get(
+                Path(self.repository_root_path, relative_file_path).as_uri()
+            )
+        key = (func.__name__, relative_file_path, args, None if file_buffer is None else file_buffer.version)
+
+        future = self._pending_requests.get(key)
+        if future is None:
+            # Edits change the buffer on the event loop, so its contents and version are read together here
+            # rather than on the worker thread, where an edit could land between the two reads
+            snapshot = None
+            if file_buffer is not None:
+                snapshot = (
+                    os.path.join(self.repository_root_path, relative_file_path),
+                    file_buffer,
+                    file_buffer.contents,
+                    file_buffer.version,
+                )
+            future = asyncio.get_running_loop().run_in_executor(
+                _JEDI_EXECUTOR, self._run_with_buffer_snapshot, snapshot, func, relative_file_path, *args
+            )
+            self._pending_requests[key] = future
+
+            def _forget(done: "asyncio.Future[Any]") -> None:
+                if self._pending_requests.get(key) is done:
+                    del self._pending_requests[key]
+
+            future.add_done_callback(_forget)
+            # Shield the shared future so that one cancelled caller does not cancel it for the others
+            return await asyncio.shield(future)
+
+        # Callers that joined a pending request get their own copy of the (nested, mutable) result,
+        # so that modifying it cannot affect the result seen by any other caller
+        return copy.deepcopy(await asyncio.shield(future))
+
+    def _run_with_buffer_snapshot(
+        self, snapshot: Optional[Tuple[str, LSPFileBuffer, str, int]], func: Callable[..., R], relative_file_path: str, *args: Any
+    ) -> R:
+        """
+        Runs a Jedi operation on the worker thread with the given open-buffer snapshot visible to _get_script
+        """
+        self._buffer_snapshot = snapshot
+        try:
+            with self._parso_cache_directory_applied():
+                return func(relative_file_path, *args)
+        finally:
+            self._buffer_snapshot = None
+
+    def _warm_up_environment(self) -> None:
+        """
+        Resolves the project's Jedi environment once and caches what every request needs from it: the environment
+        itself, its sys.path (which Jedi obtains from a subprocess) and the hash of its grammar
+        """
+        try:
+            with self._parso_cache_directory_applied():
+                environment = self.project.get_environment()
+                environment.get_sys_path()
+                self._hashed_grammar = environment.get_grammar()._hashed
+            self.logger.log(f"Jedi environment ready: {environment.executable}", logging.INFO)
+        except Exception as e:
+            self.logger.log(f"Error preparing Jedi environment: {str(e)}", logging.WARNING)
+
+    @contextmanager
+    def _parso_cache_directory_applied(self) -> Iterator[None]:
+        """
+        Points Jedi's parso disk cache at this repository's cache directory for the duration of one Jedi operation.
+        The setting is global to the process, so the previous value is restored afterwards rather than left for
+        other Jedi users and other JediServer instances.
+        """
+        if self._parso_cache_directory is None:
+            yield
+            return
+        previous_cache_directory = self.jedi.settings.cache_directory
+        self.jedi.settings.cache_directory = self._parso_cache_directory
+        try:
+            yield
+        finally:
+            self.jedi.settings.cache_directory = previous_cache_directory
+
+    def _log_traceback(self) -> None:
+        """
+        Logs the traceback of the exception being handled, only when DEBUG logging is enabled since formatting it is costly
+        """
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.DEBUG)
+
+    def _prepare_script(self, relative_file_path: str) -> Optional[_CachedScript]:
+        """
+        Returns the cached Jedi Script for the given file, or None (after logging the reason) if the file
+        does not exist or could not be read and parsed.
+        """
+        absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
+        try:
+            return self._get_script(absolute_file_path)
+        except FileNotFoundError:
+            self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
+            return None
+        except Exception as e:
+            self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
+            return None
+
+    def _uri_and_relpath(self, module_path: Any) -> Tuple[str, str]:
+        """
+        Returns the file URI and the repository-relative path for a Jedi module path
+        """
+        key = str(module_path)
+        value = self._uri_cache.get(key)
+        if value is None:
+            value = (Path(key).as_uri(), os.path.relpath(key, self.repository_root_path))
+            self._uri_cache[key] = value
+        return value
+
+    def _get_script(self, absolute_file_path: str) -> _CachedScript:
+        """
+        Returns the Jedi Script for the given file, reusing the cached Script (and the names derived from it)
+        so that repeated requests skip the read and parse. Open files are served from their in-memory buffer,
+        so unsaved edits are seen and validated by buffer version; other files are validated by their mtime and size.
+        """
+        cached = self._script_cache.get(absolute_file_path)
+
+        snapshot = self._buffer_snapshot
+        if snapshot is not None and snapshot[0] == absolute_file_path:
+            # The snapshot was taken on the event loop, so its contents belong to its version. Every edit bumps
+            # the buffer version and reopening creates a new buffer, so an entry built from this buffer at this
+            # version is current without a stat or a content comparison.
+            _, file_buffer, contents, version = snapshot
+            if cached is not None and cached.buffer is file_buffer and cached.buffer_version == version:
+                self._script_cache.move_to_end(absolute_file_path)
+                return cached
+            # Buffer-backed entries never match a stat, so closing the file revalidates against the disk
+            cached = self._build_script(absolute_file_path, contents, -1, -1, None)
+            cached.buffer, cached.buffer_version = file_buffer, version
+            return cached
+
+        st = os.stat(absolute_file_path)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            self._script_cache.move_to_end(absolute_file_path)
+            return cached
+
+        with open(absolute_file_path, 'rb') as f:
+            raw = f.read()
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.log(f"Successfully read file content, length: {len(raw)}", logging.DEBUG)
+        sha = hashlib.sha256(raw).digest()
+        if cached is not None and cached.sha == sha:
+            # Touched but unchanged: keep the parsed Script and skip decoding the file
+            cached.mtime_ns, cached.size = st.st_mtime_ns, st.st_size
+            self._script_cache.move_to_end(absolute_file_path)
+            return cached
+        return self._build_script(absolute_file_path, raw.decode('utf-8'), st.st_mtime_ns, st.st_size, sha)
+
+    def _build_script(self, absolute_file_path: str, file_content: str, mtime_ns: int, size: int, sha: Optional[bytes]) -> _CachedScript:
+        """
+        Parses the given source into a Jedi Script and stores it in the Script cache. For sources read from disk,
+        identified by the SHA-256 of their bytes, the parse tree is also loaded from or saved to the persistent parse cache.
+        """
+        parse_cache = self._parse_cache if sha is not None else None
+        seeded = False
+        if parse_cache is not None:
+            if self._hashed_grammar is None:
+                # parso keys its parser cache by the hash of the grammar Jedi parses with
+                self._hashed_grammar = self.project.get_environment().get_grammar()._hashed
+            module_path = Path(absolute_file_path).absolute()
+            try:
+                seeded = parse_cache.seed(self._hashed_grammar, module_path, file_content, sha)
+            except Exception as e:
+                self.logger.log(f"Error loading persisted parse tree for {absolute_file_path}: {str(e)}", logging.WARNING)
+
+        script = self.jedi.Script(
+            code=file_content,
+            path=absolute_file_path,
+            project=self.project
+        )
+        self.logger.log("Successfully created Jedi Script object", logging.INFO)
+
+        if parse_cache is not None and not seeded:
+            try:
+                parse_cache.store(self._hashed_grammar, module_path, sha)
+            except Exception as e:
+                self.logger.log(f"Error persisting parse tree for {absolute_file_path}: {str(e)}", logging.WARNING)
+
+        cached = _CachedScript(mtime_ns, size, file_content, script, sha)
+        self._script_cache[absolute_file_path] = cached
+        self._script_cache.move_to_end(absolute_file_path)
+        if len(self._script_cache) > self._script_cache_size:
+            self._script_cache.popitem(last=False)
+        return cached
     
+    def _to_locations(self, names: List[Any], kind: str) -> List[multilspy_types.Location]:
+        """
+        Converts the Jedi names found for a definition or reference request into deduplicated LSP locations.
+        kind ("definition" or "reference") is only used in log messages.
+        """
+        # Remove duplicates, keeping the order in which locations were first found
+        unique_names = list({(n.module_path, n.line, n.column): n for n in names}.values())
+        
+        self.logger.log(f"Found {len(unique_names)} unique {kind}s", logging.INFO)
+        
+        # Debug info about each name
+        if unique_names and self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.log("\n".join(
+                f"{kind.capitalize()} {i+1}: {name.name}, type: {name.type}, "
+                f"module: {name.module_name}, path: {name.module_path}, "
+                f"line: {name.line}, column: {name.column}"
+                for i, name in enumerate(unique_names)
+            ), logging.DEBUG)
+        
+        # Convert Jedi names to LSP locations
+        locations = []
+        for name in unique_names:
+            try:
+                # Jedi computes these attributes on every access, so read each one once
+                module_path = str(name.module_path)
+                uri, relative_path = self._uri_and_relpath(module_path)
+                line_index = name.line - 1  # LSP uses 0-based line numbers
+                start_character = name.column
+                locations.append(multilspy_types.Location(
+                    uri=uri,
+                    range={
+                        "start": {"line": line_index, "character": start_character},
+                        "end": {"line": line_index, "character": start_character + len(name.name)},
+                    },
+                    absolutePath=module_path,
+                    relativePath=relative_path,
+                ))
+            except Exception as e:
+                self.logger.log(f"Error converting {kind} to location: {str(e)}", logging.ERROR)
+        
+        self.logger.log(f"Successfully converted {len(locations)} {kind}s to locations", logging.INFO)
+        return locations
+
     async def request_document_symbols(self, relative_file_path: str) -> Tuple[List[multilspy_types.UnifiedSymbolInformation], Union[List[multilspy_types.TreeRepr], None]]:
         """
         Requests the document symbols for the given file path using direct Jedi API.
@@ -106,65 +623,37 @@ class JediServer(LanguageServer):
         :param relative_file_path: The relative path of the file that has the symbols
         :return: A tuple containing a list of symbols in the file and the tree representation (None for now)
         """
-        # Try the direct Jedi approach first
+        return await self._run_in_jedi_thread(self._sync_document_symbols, relative_file_path)
+
+    def _sync_document_symbols(self, relative_file_path: str) -> Tuple[List[multilspy_types.UnifiedSymbolInformation], Union[List[multilspy_types.TreeRepr], None]]:
+        """
+        Synchronous part of request_document_symbols, run on the Jedi worker thread.
+        """
         try:
-            absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
-            self.logger.log(f"Finding symbols in {absolute_file_path}", logging.INFO)
+            self.logger.log(f"Finding symbols in {relative_file_path}", logging.INFO)
             
-            # Check if file exists
-            if not os.path.exists(absolute_file_path):
-                self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
-                return await super().request_document_symbols(relative_file_path)
-            
-            # Read file content
-            try:
-                with open(absolute_file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.logger.log(f"Successfully read file content, length: {len(file_content)}", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error reading file: {str(e)}", logging.ERROR)
-                return await super().request_document_symbols(relative_file_path)
-            
-            # Create a Script object
-            try:
-                script = self.jedi.Script(
-                    code=file_content,
-                    path=absolute_file_path,
-                    project=self.project
-                )
-                self.logger.log("Successfully created Jedi Script object", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
-                return await super().request_document_symbols(relative_file_path)
+            cached_script = self._prepare_script(relative_file_path)
+            if cached_script is None:
+                return [], None
+            script = cached_script.script
             
             # Get all names defined in the file
             try:
-                all_names = script.get_names(all_scopes=True, definitions=True)
+                all_names, _ = cached_script.get_names()
                 self.logger.log(f"Found {len(all_names)} names in the file", logging.INFO)
             except Exception as e:
                 self.logger.log(f"Error getting names: {str(e)}", logging.ERROR)
-                return await super().request_document_symbols(relative_file_path)
-            
-            # Map Jedi types to LSP symbol kinds
-            JEDI_TYPE_TO_SYMBOL_KIND = {
-                "module": multilspy_types.SymbolKind.Module,
-                "class": multilspy_types.SymbolKind.Class,
-                "function": multilspy_types.SymbolKind.Function,
-                "statement": multilspy_types.SymbolKind.Variable,
-                "instance": multilspy_types.SymbolKind.Variable,
-                "param": multilspy_types.SymbolKind.Variable,
-                "import": multilspy_types.SymbolKind.Module,
-                "property": multilspy_types.SymbolKind.Property,
-                "method": multilspy_types.SymbolKind.Method,
-                "keyword": multilspy_types.SymbolKind.Constant,
-            }
+                return [], None
             
             # Convert Jedi names to UnifiedSymbolInformation objects
             symbols = []
+            kind_variable = multilspy_types.SymbolKind.Variable
+            debug_enabled = self.logger.is_enabled_for(logging.DEBUG)
+            debug_lines = []
             for name in all_names:
                 try:
                     # Get the symbol kind
-                    symbol_kind = JEDI_TYPE_TO_SYMBOL_KIND.get(name.type, multilspy_types.SymbolKind.Variable)
+                    symbol_kind = _JEDI_TYPE_TO_SYMBOL_KIND.get(name.type, kind_variable)
                     
                     # Get the start and end positions
                     start_pos = name.get_definition_start_position()
@@ -173,48 +662,38 @@ class JediServer(LanguageServer):
                     if start_pos is None or end_pos is None:
                         continue
                     
-                    # Create the range
-                    range_obj = {
-                        "start": {
-                            "line": start_pos[0] - 1,  # Convert from 1-based to 0-based
-                            "character": start_pos[1]
+                    # Build the symbol directly, with the range around the whole definition and
+                    # the selection range on just the name (converting from 1-based to 0-based lines)
+                    name_text = name.name
+                    name_line = name.line - 1
+                    name_column = name.column
+                    symbol = multilspy_types.UnifiedSymbolInformation(
+                        name=name_text,
+                        kind=symbol_kind,
+                        range={
+                            "start": {"line": start_pos[0] - 1, "character": start_pos[1]},
+                            "end": {"line": end_pos[0] - 1, "character": end_pos[1]},
                         },
-                        "end": {
-                            "line": end_pos[0] - 1,  # Convert from 1-based to 0-based
-                            "character": end_pos[1]
-                        }
-                    }
-                    
-                    # Create the selection range (just the name itself)
-                    selection_range = {
-                        "start": {
-                            "line": name.line - 1,  # Convert from 1-based to 0-based
-                            "character": name.column
+                        selectionRange={
+                            "start": {"line": name_line, "character": name_column},
+                            "end": {"line": name_line, "character": name_column + len(name_text)},
                         },
-                        "end": {
-                            "line": name.line - 1,  # Convert from 1-based to 0-based
-                            "character": name.column + len(name.name)
-                        }
-                    }
-                    
-                    # Create the symbol information
-                    symbol = {
-                        "name": name.name,
-                        "kind": symbol_kind,
-                        "range": range_obj,
-                        "selectionRange": selection_range
-                    }
+                    )
                     
                     # Add detail if available
-                    if hasattr(name, "description") and name.description:
-                        symbol["detail"] = name.description
+                    description = name.description
+                    if description:
+                        symbol["detail"] = description
                     
                     # Add to the list of symbols
-                    symbols.append(multilspy_types.UnifiedSymbolInformation(**symbol))
-                    self.logger.log(f"Added symbol: {name.name}, type: {name.type}, kind: {symbol_kind}", logging.INFO)
+                    symbols.append(symbol)
+                    if debug_enabled:
+                        debug_lines.append(f"Added symbol: {name.name}, type: {name.type}, kind: {symbol_kind}")
                 except Exception as e:
                     self.logger.log(f"Error processing symbol {name.name}: {str(e)}", logging.ERROR)
             
+            if debug_lines:
+                self.logger.log("\n".join(debug_lines), logging.DEBUG)
             self.logger.log(f"Successfully converted {len(symbols)} symbols", logging.INFO)
             
             # For now, we don't build a tree representation
@@ -223,72 +702,47 @@ class JediServer(LanguageServer):
             if symbols:
                 return symbols, tree_repr
             
-            # Fall back to the original implementation if no symbols were found
             self.logger.log(f"request_document_symbols: No symbols found with direct Jedi approach {relative_file_path}", logging.INFO)
 
             return [], None
         except Exception as e:
-            import traceback
             self.logger.log(f"Error in direct Jedi approach: {relative_file_path}:{str(e)} ", logging.ERROR)
-            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.ERROR)
+            self._log_traceback()
             return [], None
+
     async def request_definition(
         self, relative_file_path: str, line: int, column: int
     ) -> List[multilspy_types.Location]:
         """
         Requests the definition of a symbol at the specified line and column in the given file.
         """
-        # Try the direct Jedi approach first
+        return await self._run_in_jedi_thread(self._sync_definition, relative_file_path, line, column)
+
+    def _sync_definition(self, relative_file_path: str, line: int, column: int) -> List[multilspy_types.Location]:
+        """
+        Synchronous part of request_definition, run on the Jedi worker thread.
+        """
         try:
-            absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
-            self.logger.log(f"Finding definitions in {absolute_file_path} at line {line}, column {column}", logging.INFO)
-            
-            # Check if file exists
-            if not os.path.exists(absolute_file_path):
-                self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
-                return await super().request_definition(relative_file_path, line, column)
+            self.logger.log(f"Finding definitions in {relative_file_path} at line {line}, column {column}", logging.INFO)
             
-            # Read file content
-            try:
-                with open(absolute_file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.logger.log(f"Successfully read file content, length: {len(file_content)}", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error reading file: {str(e)}", logging.ERROR)
-                return await super().request_definition(relative_file_path, line, column)
-            
-            # Create a Script object
-            try:
-                script = self.jedi.Script(
-                    code=file_content,
-                    path=absolute_file_path,
-                    project=self.project
-                )
-                self.logger.log("Successfully created Jedi Script object", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
-                return await super().request_definition(relative_file_path, line, column)
+            cached_script = self._prepare_script(relative_file_path)
+            if cached_script is None:
+                return []
+            script = cached_script.script
             
             # Try different Jedi methods to find definitions
             definitions = []
             
-            # Get all names defined in the file
+            # Get all names defined in the file; the line-content fallback below reuses them
+            names_by_line = {}
             try:
-                all_names = script.get_names(all_scopes=True, definitions=True)
+                all_names, names_by_line = cached_script.get_names()
                 self.logger.log(f"Found {len(all_names)} names in the file", logging.INFO)
                 
-                # Find names at or near the current position
-                names_at_position = []
-                for name in all_names:
-                    # Jedi uses 1-based line numbers
-                    if name.line == line + 1:
-                        # Check if the cursor is within or near the name
-                        name_start = name.column
-                        name_end = name.column + len(name.name)
-                        # Allow a small margin around the name
-                        if max(0, name_start - 5) <= column <= name_end + 5:
-                            names_at_position.append(name)
-                            self.logger.log(f"Found name at position: {name.name}, type: {name.type}, line: {name.line}, column: {name.column}", logging.INFO)
+                # Find names at or near the current position (Jedi uses 1-based line numbers)
+                names_at_position = cached_script.names_near(line + 1, column)
+                for name in names_at_position:
+                    self.logger.log(f"Found name at position: {name.name}, type: {name.type}, line: {name.line}, column: {name.column}", logging.INFO)
                 
                 if names_at_position:
                     # Add these names' definitions to our list
@@ -316,16 +770,17 @@ class JediServer(LanguageServer):
             except Exception as e:
                 self.logger.log(f"Error in Jedi goto: {str(e)}", logging.INFO)
             
-            # Method 2: infer
-            try:
-                infer_defs = script.infer(
-                    line=line + 1,  # Jedi uses 1-based line numbers
-                    column=column
-                )
-                self.logger.log(f"Jedi infer found {len(infer_defs)} definitions", logging.INFO)
-                definitions.extend(infer_defs)
-            except Exception as e:
-                self.logger.log(f"Error in Jedi infer: {str(e)}", logging.INFO)
+            # Method 2: infer, which runs type inference and is only worth its cost if goto found nothing
+            if not definitions:
+                try:
+                    infer_defs = script.infer(
+                        line=line + 1,  # Jedi uses 1-based line numbers
+                        column=column
+                    )
+                    self.logger.log(f"Jedi infer found {len(infer_defs)} definitions", logging.INFO)
+                    definitions.extend(infer_defs)
+                except Exception as e:
+                    self.logger.log(f"Error in Jedi infer: {str(e)}", logging.INFO)
             
             # Method 3: Try direct position-based methods
             
@@ -333,15 +788,14 @@ class JediServer(LanguageServer):
             if not definitions:
                 try:
                     # Get the line content
-                    lines = file_content.splitlines()
-                    if line < len(lines):
-                        line_content = lines[line]
+                    line_content = cached_script.get_line(line)
+                    if line_content is not None:
                         self.logger.log(f"Line content: {line_content}", logging.INFO)
                         
                         # Check if this is a function or class definition
                         if line_content.strip().startswith("def ") or line_content.strip().startswith("class "):
                             # Get all names again but filter specifically for this line
-                            specific_names = [name for name in all_names if name.line == line + 1]
+                            specific_names = names_by_line.get(line + 1, [])
                             
                             if specific_names:
                                 for name in specific_names:
@@ -351,48 +805,7 @@ class JediServer(LanguageServer):
                 except Exception as e:
                     self.logger.log(f"Error checking line content: {str(e)}", logging.INFO)
             
-            # Remove duplicates
-            unique_defs = []
-            seen_paths_lines = set()
-            for definition in definitions:
-                key = (definition.module_path, definition.line, definition.column)
-                if key not in seen_paths_lines:
-                    seen_paths_lines.add(key)
-                    unique_defs.append(definition)
-            
-            self.logger.log(f"Found {len(unique_defs)} unique definitions", logging.INFO)
-            
-            # Debug info about each definition
-            for i, definition in enumerate(unique_defs):
-                self.logger.log(f"Definition {i+1}: {definition.name}, type: {definition.type}, "
-                               f"module: {definition.module_name}, path: {definition.module_path}, "
-                               f"line: {definition.line}, column: {definition.column}", logging.INFO)
-            
-            # Convert Jedi definitions to LSP locations
-            locations = []
-            for definition in unique_defs:
-                try:
-                    uri = Path(definition.module_path).as_uri()
-                    location = {
-                        "uri": uri,
-                        "range": {
-                            "start": {
-                                "line": definition.line - 1,  # LSP uses 0-based line numbers
-                                "character": definition.column
-                            },
-                            "end": {
-                                "line": definition.line - 1,
-                                "character": definition.column + len(definition.name)
-                            }
-                        },
-                        "absolutePath": str(definition.module_path),
-                        "relativePath": os.path.relpath(str(definition.module_path), self.repository_root_path)
-                    }
-                    locations.append(multilspy_types.Location(**location))
-                except Exception as e:
-                    self.logger.log(f"Error converting definition to location: {str(e)}", logging.ERROR)
-            
-            self.logger.log(f"Successfully converted {len(locations)} definitions to locations", logging.INFO)
+            locations = self._to_locations(definitions, "definition")
             
             if locations:
                 return locations
@@ -401,66 +814,39 @@ class JediServer(LanguageServer):
             return []
             
         except Exception as e:
-            import traceback
             self.logger.log(f"Error in direct Jedi approach: {str(e)}", logging.ERROR)
-            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.ERROR)
+            self._log_traceback()
             return []
 
-    
     async def request_references(
         self, relative_file_path: str, line: int, column: int
     ) -> List[multilspy_types.Location]:
         """
         Requests the references of a symbol at the specified line and column in the given file.
         """
-        # Try the direct Jedi approach first
+        return await self._run_in_jedi_thread(self._sync_references, relative_file_path, line, column)
+
+    def _sync_references(self, relative_file_path: str, line: int, column: int) -> List[multilspy_types.Location]:
+        """
+        Synchronous part of request_references, run on the Jedi worker thread.
+        """
         try:
-            absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
-            self.logger.log(f"Finding references in {absolute_file_path} at line {line}, column {column}", logging.INFO)
-            
-            # Check if file exists
-            if not os.path.exists(absolute_file_path):
-                self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
-                return await super().request_references(relative_file_path, line, column)
+            self.logger.log(f"Finding references in {relative_file_path} at line {line}, column {column}", logging.INFO)
             
-            # Read file content
-            try:
-                with open(absolute_file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.logger.log(f"Successfully read file content, length: {len(file_content)}", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error reading file: {str(e)}", logging.ERROR)
-                return await super().request_references(relative_file_path, line, column)
-            
-            # Create a Script object
-            try:
-                script = self.jedi.Script(
-                    code=file_content,
-                    path=absolute_file_path,
-                    project=self.project
-                )
-                self.logger.log("Successfully created Jedi Script object", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
-                return await super().request_references(relative_file_path, line, column)
+            cached_script = self._prepare_script(relative_file_path)
+            if cached_script is None:
+                return []
+            script = cached_script.script
             
             # Get all names defined in the file
             try:
-                all_names = script.get_names(all_scopes=True, definitions=True)
+                all_names, _ = cached_script.get_names()
                 self.logger.log(f"Found {len(all_names)} names in the file", logging.INFO)
                 
-                # Find names at or near the current position
-                names_at_position = []
-                for name in all_names:
-                    # Jedi uses 1-based line numbers
-                    if name.line == line + 1:
-                        # Check if the cursor is within or near the name
-                        name_start = name.column
-                        name_end = name.column + len(name.name)
-                        # Allow a small margin around the name
-                        if max(0, name_start - 5) <= column <= name_end + 5:
-                            names_at_position.append(name)
-                            self.logger.log(f"Found name at position: {name.name}, type: {name.type}, line: {name.line}, column: {name.column}", logging.INFO)
+                # Find names at or near the current position (Jedi uses 1-based line numbers)
+                names_at_position = cached_script.names_near(line + 1, column)
+                for name in names_at_position:
+                    self.logger.log(f"Found name at position: {name.name}, type: {name.type}, line: {name.line}, column: {name.column}", logging.INFO)
                 
                 if names_at_position:
                     # Use these names for references
@@ -496,48 +882,7 @@ class JediServer(LanguageServer):
                 except Exception as e:
                     self.logger.log(f"Error in name get_references: {str(e)}", logging.INFO)
             
-            # Remove duplicates
-            unique_refs = []
-            seen_paths_lines = set()
-            for reference in references:
-                key = (reference.module_path, reference.line, reference.column)
-                if key not in seen_paths_lines:
-                    seen_paths_lines.add(key)
-                    unique_refs.append(reference)
-            
-            self.logger.log(f"Found {len(unique_refs)} unique references", logging.INFO)
-            
-            # Debug info about each reference
-            for i, reference in enumerate(unique_refs):
-                self.logger.log(f"Reference {i+1}: {reference.name}, type: {reference.type}, "
-                               f"module: {reference.module_name}, path: {reference.module_path}, "
-                               f"line: {reference.line}, column: {reference.column}", logging.INFO)
-            
-            # Convert Jedi references to LSP locations
-            locations = []
-            for reference in unique_refs:
-                try:
-                    uri = Path(reference.module_path).as_uri()
-                    location = {
-                        "uri": uri,
-                        "range": {
-                            "start": {
-                                "line": reference.line - 1,  # LSP uses 0-based line numbers
-                                "character": reference.column
-                            },
-                            "end": {
-                                "line": reference.line - 1,
-                                "character": reference.column + len(reference.name)
-                            }
-                        },
-                        "absolutePath": str(reference.module_path),
-                        "relativePath": os.path.relpath(str(reference.module_path), self.repository_root_path)
-                    }
-                    locations.append(multilspy_types.Location(**location))
-                except Exception as e:
-                    self.logger.log(f"Error converting reference to location: {str(e)}", logging.ERROR)
-            
-            self.logger.log(f"Successfully converted {len(locations)} references to locations", logging.INFO)
+            locations = self._to_locations(references, "reference")
             
             if locations:
                 return locations
@@ -546,10 +891,10 @@ class JediServer(LanguageServer):
             return []
             
         except Exception as e:
-            import traceback
             self.logger.log(f"Error in direct Jedi approach: {str(e)}", logging.ERROR)
-            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.ERROR)
+            self._log_traceback()
             return []
+
     async def request_completions(
         self, relative_file_path: str, line: int, column: int, allow_incomplete: bool = False
     ) -> List[multilspy_types.CompletionItem]:
@@ -562,34 +907,24 @@ class JediServer(LanguageServer):
         :param allow_incomplete: Whether to allow incomplete completions
         :return: A list of completion items
         """
+        return await self._run_in_jedi_thread(self._sync_completions, relative_file_path, line, column)
+
+    def _sync_completions(self, relative_file_path: str, line: int, column: int) -> List[multilspy_types.CompletionItem]:
+        """
+        Synchronous part of request_completions, run on the Jedi worker thread.
+        """
         try:
-            absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
-            self.logger.log(f"Finding completions in {absolute_file_path} at line {line}, column {column}", logging.INFO)
+            self.logger.log(f"Finding completions in {relative_file_path} at line {line}, column {column}", logging.INFO)
             
-            # Check if file exists
-            if not os.path.exists(absolute_file_path):
-                self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
+            cached_script = self._prepare_script(relative_file_path)
+            if cached_script is None:
                 return []
+            script = cached_script.script
             
-            # Read file content
-            try:
-                with open(absolute_file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.logger.log(f"Successfully read file content, length: {len(file_content)}", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error reading file: {str(e)}", logging.ERROR)
-                return []
-            
-            # Create a Script object
-            try:
-                script = self.jedi.Script(
-                    code=file_content,
-                    path=absolute_file_path,
-                    project=self.project
-                )
-                self.logger.log("Successfully created Jedi Script object", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
+            # Skip Jedi's inference when the text before the cursor cannot be completed
+            line_content = cached_script.get_line(line)
+            if line_content is not None and _cannot_complete_after(line_content[:column]):
+                self.logger.log("No completions possible at this position", logging.INFO)
                 return []
             
             # Get completions
@@ -603,55 +938,46 @@ class JediServer(LanguageServer):
                 self.logger.log(f"Error getting completions: {str(e)}", logging.ERROR)
                 return []
             
-            # Map Jedi completion types to LSP completion item kinds
-            JEDI_TYPE_TO_COMPLETION_KIND = {
-                "module": multilspy_types.CompletionItemKind.Module,
-                "class": multilspy_types.CompletionItemKind.Class,
-                "function": multilspy_types.CompletionItemKind.Function,
-                "instance": multilspy_types.CompletionItemKind.Variable,
-                "statement": multilspy_types.CompletionItemKind.Variable,
-                "param": multilspy_types.CompletionItemKind.Variable,
-                "import": multilspy_types.CompletionItemKind.Module,
-                "property": multilspy_types.CompletionItemKind.Property,
-                "method": multilspy_types.CompletionItemKind.Method,
-                "keyword": multilspy_types.CompletionItemKind.Keyword,
-            }
-            
             # Convert Jedi completions to CompletionItem objects
             completion_items = []
+            debug_enabled = self.logger.is_enabled_for(logging.DEBUG)
+            debug_lines = []
             for completion in completions:
                 try:
                     # Get the completion kind
-                    completion_kind = JEDI_TYPE_TO_COMPLETION_KIND.get(
+                    completion_kind = _JEDI_TYPE_TO_COMPLETION_KIND.get(
                         completion.type, multilspy_types.CompletionItemKind.Text
                     )
                     
-                    # Create the completion item
-                    item = {
+                    # Create the completion item; CompletionItem is a TypedDict, so a plain dict is all it builds
+                    item: multilspy_types.CompletionItem = {
                         "completionText": completion.name,
                         "kind": completion_kind
                     }
                     
                     # Add detail if available
-                    if hasattr(completion, "description") and completion.description:
-                        item["detail"] = completion.description
+                    description = completion.description
+                    if description:
+                        item["detail"] = description
                     
                     # Add to the list of completion items
-                    completion_items.append(multilspy_types.CompletionItem(**item))
-                    self.logger.log(f"Added completion: {completion.name}, type: {completion.type}, kind: {completion_kind}", logging.INFO)
+                    completion_items.append(item)
+                    if debug_enabled:
+                        debug_lines.append(f"Added completion: {completion.name}, type: {completion.type}, kind: {completion_kind}")
                 except Exception as e:
                     self.logger.log(f"Error processing completion {completion.name}: {str(e)}", logging.ERROR)
             
+            if debug_lines:
+                self.logger.log("\n".join(debug_lines), logging.DEBUG)
             self.logger.log(f"Successfully converted {len(completion_items)} completions", logging.INFO)
             
             return completion_items
             
         except Exception as e:
-            import traceback
             self.logger.log(f"Error in direct Jedi approach for completions: {str(e)}", logging.ERROR)
-            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.ERROR)
+            self._log_traceback()
             return []
-    
+
     async def request_hover(self, relative_file_path: str, line: int, column: int) -> Union[multilspy_types.Hover, None]:
         """
         Requests hover information at the specified line and column in the given file using direct Jedi API.
@@ -661,35 +987,19 @@ class JediServer(LanguageServer):
         :param column: The column number
         :return: Hover information or None if not available
         """
+        return await self._run_in_jedi_thread(self._sync_hover, relative_file_path, line, column)
+
+    def _sync_hover(self, relative_file_path: str, line: int, column: int) -> Union[multilspy_types.Hover, None]:
+        """
+        Synchronous part of request_hover, run on the Jedi worker thread.
+        """
         try:
-            absolute_file_path = os.path.join(self.repository_root_path, relative_file_path)
-            self.logger.log(f"Finding hover info in {absolute_file_path} at line {line}, column {column}", logging.INFO)
+            self.logger.log(f"Finding hover info in {relative_file_path} at line {line}, column {column}", logging.INFO)
             
-            # Check if file exists
-            if not os.path.exists(absolute_file_path):
-                self.logger.log(f"File does not exist: {absolute_file_path}", logging.ERROR)
-                return None
-            
-            # Read file content
-            try:
-                with open(absolute_file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.logger.log(f"Successfully read file content, length: {len(file_content)}", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error reading file: {str(e)}", logging.ERROR)
-                return None
-            
-            # Create a Script object
-            try:
-                script = self.jedi.Script(
-                    code=file_content,
-                    path=absolute_file_path,
-                    project=self.project
-                )
-                self.logger.log("Successfully created Jedi Script object", logging.INFO)
-            except Exception as e:
-                self.logger.log(f"Error creating Jedi Script: {str(e)}", logging.ERROR)
+            cached_script = self._prepare_script(relative_file_path)
+            if cached_script is None:
                 return None
+            script = cached_script.script
             
             # Try to get help on the symbol
             try:
@@ -707,14 +1017,7 @@ class JediServer(LanguageServer):
                     self.logger.log(f"Found hover info: {help_text[:100]}...", logging.INFO)
                     
                     # Create the hover information
-                    hover = {
-                        "contents": {
-                            "kind": "markdown",
-                            "value": f"```python\n{help_text}\n```"
-                        }
-                    }
-                    
-                    return multilspy_types.Hover(**hover)
+                    return {"contents": {"kind": "markdown", "value": _HOVER_CODE_FENCE(help_text)}}
                 else:
                     self.logger.log("No hover info found", logging.INFO)
                     return None
@@ -724,32 +1027,24 @@ class JediServer(LanguageServer):
                 return None
             
         except Exception as e:
-            import traceback
             self.logger.log(f"Error in direct Jedi approach for hover: {str(e)}", logging.ERROR)
-            self.logger.log(f"Traceback: {traceback.format_exc()}", logging.ERROR)
+            self._log_traceback()
             return None
-    
+
     def _get_initialize_params(self, repository_absolute_path: str) -> InitializeParams:
         """
         Returns the initialize params for the Jedi Language Server.
         This is kept for compatibility but not actually used in direct Jedi API mode.
         """
-        with open(os.path.join(os.path.dirname(__file__), "initialize_params.json"), "r") as f:
-            d = json.load(f)
-
-        del d["_description"]
+        # The template is parsed and checked once; each call fills in a private copy
+        d = copy.deepcopy(_initialize_params_template())
 
         d["processId"] = os.getpid()
-        assert d["rootPath"] == "$rootPath"
         d["rootPath"] = repository_absolute_path
 
-        assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["name"] == "$name"
+        root_uri = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = root_uri
+        d["workspaceFolders"][0]["uri"] = root_uri
         d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
 
         return d
@@ -773,13 +1068,42 @@ class JediServer(LanguageServer):
         # Set server_started flag to true to allow operations
         self.server_started = True
         
-        # Set completions_available event to allow completions to work
-        self.completions_available.set()
+        # Set completions_available event to allow completions to work; there is no
+        # server to wait on, so only set it the first time the context is entered
+        if not self.completions_available.is_set():
+            self.completions_available.set()
         
         self.logger.log("Using direct Jedi API mode (no server process needed)", logging.INFO)
         
+        repository_hash = hashlib.sha1(os.path.abspath(self.repository_root_path).encode('utf-8')).hexdigest()
+        repository_cache_directory = os.path.join(MultilspySettings.get_global_cache_directory(), "jedi", repository_hash)
+        try:
+            parso_cache_directory = os.path.join(repository_cache_directory, "parso")
+            os.makedirs(parso_cache_directory, exist_ok=True)
+            self._parso_cache_directory = parso_cache_directory
+        except OSError as e:
+            self.logger.log(f"Parso cache directory unavailable: {str(e)}", logging.WARNING)
+        if self._parse_cache is None:
+            try:
+                self._parse_cache = _PersistentParseCache(
+                    os.path.join(repository_cache_directory, "parse_cache.db")
+                )
+            except Exception as e:
+                self.logger.log(f"Persistent parse cache unavailable: {str(e)}", logging.WARNING)
+        self._server_scopes += 1
+        
+        # Resolve the Jedi environment now rather than during the first request
+        await asyncio.get_running_loop().run_in_executor(_JEDI_EXECUTOR, self._warm_up_environment)
+        
         try:
             yield self
         finally:
             # Reset state on exit
             self.server_started = False
+            self._server_scopes -= 1
+            parse_cache = self._parse_cache
+            if self._server_scopes == 0 and parse_cache is not None:
+                # Detach the cache first, so a scope entered while it closes opens a connection of its own
+                self._parse_cache = None
+                # Wait for queued Jedi work so nothing uses the connection after it is closed
+                await asyncio.get_running_loop().run_in_executor(_JEDI_EXECUTOR, parse_cache.close)
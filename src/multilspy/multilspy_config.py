@@ -33,6 +33,8 @@ class MultilspyConfig:
     """
     code_language: Language
     trace_lsp_communication: bool = False
+    # Maximum number of parsed source files the Jedi language server keeps in memory
+    jedi_script_cache_size: int = 128
 
     @classmethod
     def from_dict(cls, env: dict):
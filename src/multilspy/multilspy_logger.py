@@ -28,6 +28,14 @@ class MultilspyLogger:
         self.logger = logging.getLogger("multilspy")
         self.logger.setLevel(logging.INFO)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Returns whether a message of the given level would be logged, so callers can skip building verbose messages
+        """
+        # Subclasses that override log() may not initialize the underlying logger; they receive every message
+        logger = getattr(self, "logger", None)
+        return logger is None or logger.isEnabledFor(level)
+
     def log(self, debug_message: str, level: int, sanitized_error_message: str = "") -> None:
         """
         Log the debug and santized messages using the logger
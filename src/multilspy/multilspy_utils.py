@@ -5,7 +5,7 @@ This file contains various utility functions like I/O operations, handling paths
 import gzip
 import logging
 import os
-from typing import Tuple
+from typing import Any, Tuple
 import requests
 import shutil
 import uuid
@@ -14,6 +14,12 @@ import platform
 import subprocess
 from enum import Enum
 
+try:
+    # orjson parses bytes directly and is noticeably faster; it is optional
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from multilspy.multilspy_exceptions import MultilspyException
 from pathlib import PurePath, Path
 from multilspy.multilspy_logger import MultilspyLogger
@@ -94,6 +100,13 @@ class FileUtils:
     Utility functions for file operations.
     """
 
+    @staticmethod
+    def read_json(path: str) -> Any:
+        """
+        Reads and parses the JSON file at the given path, using orjson when it is installed
+        """
+        return _json.loads(Path(path).read_bytes())
+
     @staticmethod
     def read_file(logger: MultilspyLogger, file_path: str) -> str:
         """
@@ -134,6 +147,9 @@ class FileUtils:
         """
         Downloads the archive from the given URL having format {archive_type} and extracts it to the given {target_path}
         """
+        if archive_type == "gz":
+            FileUtils.download_and_extract_gz(logger, url, target_path)
+            return
         try:
             tmp_files = []
             tmp_file_name = str(PurePath(os.path.expanduser("~"), "multilspy_tmp", uuid.uuid4().hex))
@@ -150,9 +166,6 @@ class FileUtils:
                 with gzip.open(tmp_file_name, "rb") as f_in, open(tmp_file_name_ungzipped, "wb") as f_out:
                     shutil.copyfileobj(f_in, f_out)
                 shutil.unpack_archive(tmp_file_name_ungzipped, target_path, "zip")
-            elif archive_type == "gz":
-                with gzip.open(tmp_file_name, "rb") as f_in, open(target_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
             else:
                 logger.log(f"Unknown archive type '{archive_type}' for extraction", logging.ERROR)
                 raise MultilspyException(f"Unknown archive type '{archive_type}'")
@@ -164,6 +177,31 @@ class FileUtils:
                 if os.path.exists(tmp_file_name):
                     Path.unlink(Path(tmp_file_name))
 
+    @staticmethod
+    def download_and_extract_gz(logger: MultilspyLogger, url: str, target_path: str) -> None:
+        """
+        Downloads a single gzip-compressed file from the given URL to the given {target_path}, decompressing the
+        response as it streams in instead of first writing the archive to a temporary file
+        """
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        partial_path = target_path + ".part"
+        try:
+            with requests.get(url, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    logger.log(f"Error downloading file '{url}': {response.status_code}", logging.ERROR)
+                    raise MultilspyException("Error downloading file.")
+                with gzip.GzipFile(fileobj=response.raw) as f_in, open(partial_path, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+            os.replace(partial_path, target_path)
+        except MultilspyException:
+            raise
+        except Exception as exc:
+            logger.log(f"Error extracting archive obtained from '{url}': {exc}", logging.ERROR)
+            raise MultilspyException("Error extracting archive.") from exc
+        finally:
+            if os.path.exists(partial_path):
+                os.unlink(partial_path)
+
 class PlatformId(str, Enum):
     """
     multilspy supported platforms
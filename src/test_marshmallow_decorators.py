@@ -4,11 +4,14 @@ on the marshmallow/tests/test_decorators.py file.
 """
 
 import asyncio
+import bisect
+import functools
 import logging
 import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -16,6 +19,11 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 from multilspy.multilspy_logger import MultilspyLogger
 from multilspy.multilspy_config import MultilspyConfig, Language
 from multilspy.language_servers.jedi_language_server.jedi_server import JediServer
+from multilspy.multilspy_types import SymbolKind
+
+# Symbol kinds included in the test, and those that become dependency-graph nodes
+_CALLABLE_KINDS = frozenset({SymbolKind.Class, SymbolKind.Function, SymbolKind.Method})
+_FUNCTION_KINDS = frozenset({SymbolKind.Function, SymbolKind.Method})
 
 
 class FunctionNode:
@@ -27,8 +35,13 @@ class FunctionNode:
         self.node_type = node_type
         self.range = range_info
         self.name_range = name_range
-        self.incoming: List[str] = []  # Functions that call this function
-        self.outgoing: List[str] = []  # Functions that this function calls
+        # Positions read on every dependency-graph pass, stored as plain ints
+        self.start_line: int = range_info['start']['line']
+        self.end_line: int = range_info['end']['line']
+        self.name_line: int = name_range['start']['line']
+        self.name_end_col: int = name_range['end']['character']
+        self.incoming: Set[str] = set()  # Functions that call this function
+        self.outgoing: Set[str] = set()  # Functions that this function calls
 
 
 class TestLogger(MultilspyLogger):
@@ -42,6 +55,28 @@ class TestLogger(MultilspyLogger):
         self.logs.append((level, message))
 
 
+# Pending or finished server requests keyed by (file path, line, column)
+RequestCache = Dict[Tuple[str, int, int], "asyncio.Future[Any]"]
+
+
+async def cached_definition(server: JediServer, cache: RequestCache, file_path: str, line: int, column: int):
+    """Request the definition at a position, sharing the result with every other request for that position."""
+    key = (file_path, line, column)
+    future = cache.get(key)
+    if future is None:
+        future = cache[key] = asyncio.ensure_future(server.request_definition(file_path, line, column))
+    return await future
+
+
+async def cached_references(server: JediServer, cache: RequestCache, file_path: str, line: int, column: int):
+    """Request the references at a position, sharing the result with every other request for that position."""
+    key = (file_path, line, column)
+    future = cache.get(key)
+    if future is None:
+        future = cache[key] = asyncio.ensure_future(server.request_references(file_path, line, column))
+    return await future
+
+
 class LanguageHandler:
     """Base class for language-specific handlers."""
     
@@ -73,6 +108,10 @@ async def test_marshmallow_decorators():
     test_file_path = "marshmallow/tests/test_decorators.py"
     logger.log(f"Test file path: {test_file_path}", logging.INFO)
     
+    # Server requests shared within this run; results may be stale once the server is stopped
+    definition_cache: RequestCache = {}
+    references_cache: RequestCache = {}
+
     # Start the server
     async with server.start_server():
         logger.log("Server started", logging.INFO)
@@ -84,19 +123,33 @@ async def test_marshmallow_decorators():
         for symbol in symbols[:10]:  # Show first 10 symbols
             logger.log(f"Symbol: {symbol['name']}, kind: {symbol['kind']}", logging.INFO)
         
-        # Import SymbolKind to filter symbols
-        from multilspy.multilspy_types import SymbolKind
-        
         # Filter symbols to include only classes and functions
         class_and_function_symbols = [
             symbol for symbol in symbols 
-            if symbol['kind'] in (SymbolKind.Class, SymbolKind.Function, SymbolKind.Method)
+            if symbol['kind'] in _CALLABLE_KINDS
         ]
         
         logger.log(f"\nFound {len(class_and_function_symbols)} class and function symbols", logging.INFO)
         
-        # Test definitions and references for selected symbols
-        for i, symbol in enumerate(class_and_function_symbols):
+        # Test definitions and references for selected symbols, probing a bounded number of symbols at a time
+        probe_limit = asyncio.Semaphore(8)
+
+        async def probe(symbol):
+            definition_line = symbol['selectionRange']['start']['line']
+            definition_column = symbol['selectionRange']['start']['character']
+            async with probe_limit:
+                return await asyncio.gather(
+                    cached_definition(server, definition_cache, test_file_path, definition_line, definition_column),
+                    cached_references(server, references_cache, test_file_path, definition_line, definition_column),
+                    return_exceptions=True
+                )
+
+        probe_results = await asyncio.gather(*(probe(symbol) for symbol in class_and_function_symbols))
+
+        # Create a dictionary to store function nodes, filled from functions and methods in the same pass
+        function_nodes: Dict[str, FunctionNode] = {}
+
+        for i, (symbol, (locations, references)) in enumerate(zip(class_and_function_symbols, probe_results)):
             symbol_name = symbol['name']
             symbol_kind = "Class" if symbol['kind'] == SymbolKind.Class else "Function/Method"
             definition_line = symbol['selectionRange']['start']['line']
@@ -107,120 +160,203 @@ async def test_marshmallow_decorators():
             
             # Test definition
             logger.log(f"--- Testing definition for {symbol_name} ---", logging.INFO)
-            try:
-                locations = await server.request_definition(test_file_path, definition_line, definition_column)
+            if isinstance(locations, Exception):
+                logger.log(f"Error in request_definition for {symbol_name}: {str(locations)}", logging.ERROR)
+            else:
                 logger.log(f"Found {len(locations)} definition locations", logging.INFO)
-                for location in locations:
-                    logger.log(f"Definition at: {location['relativePath']}:{location['range']['start']['line']+1}", logging.INFO)
-            except Exception as e:
-                logger.log(f"Error in request_definition for {symbol_name}: {str(e)}", logging.ERROR)
+                if locations and logger.is_enabled_for(logging.INFO):
+                    logger.log("\n".join(
+                        f"Definition at: {location['relativePath']}:{location['range']['start']['line']+1}"
+                        for location in locations
+                    ), logging.INFO)
             
             # Test references
             logger.log(f"--- Testing references for {symbol_name} ---", logging.INFO)
-            try:
-                references = await server.request_references(test_file_path, definition_line, definition_column)
+            if isinstance(references, Exception):
+                logger.log(f"Error in request_references for {symbol_name}: {str(references)}", logging.ERROR)
+            else:
                 logger.log(f"Found {len(references)} reference locations", logging.INFO)
-                for reference in references[:5]:  # Show first 5 references
-                    logger.log(f"Reference at: {reference['relativePath']}:{reference['range']['start']['line']+1}", logging.INFO)
-            except Exception as e:
-                logger.log(f"Error in request_references for {symbol_name}: {str(e)}", logging.ERROR)
+                if references and logger.is_enabled_for(logging.INFO):
+                    logger.log("\n".join(
+                        f"Reference at: {reference['relativePath']}:{reference['range']['start']['line']+1}"
+                        for reference in references[:5]  # Show first 5 references
+                    ), logging.INFO)
+            
+            # Create a function node from the symbol
+            if symbol['kind'] in _FUNCTION_KINDS:
+                function_nodes[symbol_name] = FunctionNode(
+                    name=symbol_name,
+                    file_path=test_file_path,
+                    node_type="function",
+                    range_info=symbol['range'],
+                    name_range=symbol['selectionRange']
+                )
+                logger.log(f"Added function node: {symbol_name}", logging.INFO)
         
         # Build dependency graph
         logger.log("\n--- Building dependency graph ---", logging.INFO)
         
-        # Create a dictionary to store function nodes
-        function_nodes: Dict[str, FunctionNode] = {}
-        
         # Create a language handler
         handler = LanguageHandler()
         
-        # Create function nodes from symbols
-        for symbol in class_and_function_symbols:
-            if symbol['kind'] in (SymbolKind.Function, SymbolKind.Method):
-                func_name = symbol['name']
-                node = FunctionNode(
-                    name=func_name,
-                    file_path=test_file_path,
-                    node_type="function",
-                    range_info=symbol['range'],
-                    name_range=symbol['selectionRange']
-                )
-                function_nodes[func_name] = node
-                logger.log(f"Added function node: {func_name}", logging.INFO)
-        
         # Build the dependency graph
         logger.log("Building dependency graph...", logging.INFO)
-        for func_name, node in function_nodes.items():
-            # ValidationError (Struct) is actually on line 15, start_line is saying 14
-            logger.log(f"Analyzing references for {func_name}, {node.node_type} {node.file_path}", logging.DEBUG)
-            try:
-                with server.open_file(node.file_path):
-                    # Find all references to this function
-                    refs = await server.request_references(
+        # Index the lines owned by each function, per file, to find the function containing a reference.
+        # Where ranges overlap the function listed first owns the line; the index holds the resulting
+        # disjoint (start, end, name) intervals sorted by start line, so a lookup is a binary search.
+        line_owners: Dict[str, List[Optional[str]]] = {}
+        for caller_name, caller in reversed(list(function_nodes.items())):
+            owners = line_owners.setdefault(caller.file_path, [])
+            start_line = caller.start_line
+            end_line = caller.end_line
+            if len(owners) <= end_line:
+                owners.extend([None] * (end_line + 1 - len(owners)))
+            owners[start_line:end_line + 1] = [caller_name] * (end_line + 1 - start_line)
+        ranges_by_file: Dict[str, List[Tuple[int, int, str]]] = {}
+        for file_path, owners in line_owners.items():
+            ranges = ranges_by_file[file_path] = []
+            for line_number, owner in enumerate(owners):
+                if owner is None:
+                    continue
+                if ranges and ranges[-1][2] == owner and ranges[-1][1] == line_number - 1:
+                    ranges[-1] = (ranges[-1][0], line_number, owner)
+                else:
+                    ranges.append((line_number, line_number, owner))
+        starts_by_file = {file_path: [start for start, _, _ in ranges] for file_path, ranges in ranges_by_file.items()}
+
+        # The per-reference DEBUG messages below are only formatted when DEBUG logging is enabled
+        debug_enabled = logger.is_enabled_for(logging.DEBUG)
+
+        with ExitStack() as open_files:
+            # Open each file containing a function once for the whole graph construction
+            for file_path in {node.file_path for node in function_nodes.values()}:
+                open_files.enter_context(server.open_file(file_path))
+
+            # Find all references to every function at once
+            refs_lists = await asyncio.gather(
+                *(
+                    cached_references(
+                        server,
+                        references_cache,
                         node.file_path,
-                        node.name_range['start']['line'],
-                        node.name_range['end']['character']
+                        node.name_line,
+                        node.name_end_col
                     )
+                    for node in function_nodes.values()
+                ),
+                return_exceptions=True
+            )
 
-                    if refs:
+            # Pair each reference with the function that contains it
+            candidate_calls = []
+            # Bind the lookups made for every reference to locals
+            add_candidate = candidate_calls.append
+            get_ranges = ranges_by_file.get
+            bisect_right = bisect.bisect_right
+            for (func_name, node), refs in zip(function_nodes.items(), refs_lists):
+                # ValidationError (Struct) is actually on line 15, start_line is saying 14
+                if debug_enabled:
+                    logger.log(f"Analyzing references for {func_name}, {node.node_type} {node.file_path}", logging.DEBUG)
+                if isinstance(refs, Exception):
+                    # this will typically happen for 'main' functions
+                    logger.log(f"Could not analyze references for {func_name}: {refs}", logging.WARNING)
+                    continue
+
+                if refs:
+                    if debug_enabled:
                         logger.log(f"Found {len(refs)} references to {func_name}", logging.DEBUG)
 
-                        # Process each reference
-                        for ref in refs:
-                            ref_file = ref['relativePath']
-                            ref_line = ref['range']['start']['line']
-                            ref_col = ref['range']['start']['character']
-                            ref_end = ref['range']['end']['character']
-
-                            # Find which function contains this reference
-                            for caller_name, caller in function_nodes.items():
-                                if (caller.file_path == ref_file and
-                                    caller.range['start']['line'] <= ref_line <= caller.range['end']['line']):
-                                    logger.log(f"ref_file: {ref_file}, ref_line: {ref_line}, ref_col: {ref_col}, ref_end: {ref_end}", logging.DEBUG)
-                                    # Verify it's actually a call using definition
-                                    try:
-                                        # list of locations
-                                        defs = await server.request_definition(
-                                            ref_file,
-                                            ref_line,
-                                            ref_end
-                                        )
-                                        logger.log(f"defs: {defs}", logging.DEBUG)
-
-                                        # Use language-specific handler to process definition
-                                        if handler.process_definition(defs, node, ref_file, ref_line):
-                                            logger.log(f"  Called by: {caller_name}", logging.DEBUG)
-                                            # Use unique keys for tracking references
-                                            caller_unique_key = f"{caller.file_path}::{caller_name}"
-                                            func_unique_key = f"{node.file_path}::{func_name}"
-
-                                            if caller_unique_key not in node.incoming:
-                                                logger.log(f"  Adding {caller_unique_key} to incoming calls", logging.DEBUG)
-                                                node.incoming.append(caller_unique_key)
-                                            if func_unique_key not in caller.outgoing:
-                                                logger.log(f"  Adding {func_unique_key} to outgoing calls", logging.DEBUG)
-                                                caller.outgoing.append(func_unique_key)
-
-                                    except Exception as e:
-                                        logger.log(f"Error verifying call from {caller_name}: {e}", logging.WARNING)
-                                        print(f"David Error verifying call from {caller_name}: {e}", logging.WARNING)
-                                    break
-            except Exception as e:
-                # this will typically happen for 'main' functions
-                logger.log(f"Could not analyze references for {func_name}: {e}", logging.WARNING)
-        
+                    # Process each reference
+                    for ref in refs:
+                        ref_file = ref['relativePath']
+                        ref_range = ref['range']
+                        ref_start = ref_range['start']
+                        ref_line = ref_start['line']
+                        ref_end = ref_range['end']['character']
+
+                        # Find which function contains this reference
+                        ranges = get_ranges(ref_file)
+                        if not ranges:
+                            continue
+                        i = bisect_right(starts_by_file[ref_file], ref_line) - 1
+                        if i >= 0 and ranges[i][1] >= ref_line:
+                            caller_name = ranges[i][2]
+                            caller = function_nodes[caller_name]
+                            if debug_enabled:
+                                logger.log("ref_file: %s, ref_line: %s, ref_col: %s, ref_end: %s" % (ref_file, ref_line, ref_start['character'], ref_end), logging.DEBUG)
+                            add_candidate((func_name, node, caller_name, caller, (ref_file, ref_line, ref_end)))
+
+            # Verify that every candidate is actually a call using definition, resolving each distinct
+            # position once and all of them at once
+            unique_positions = list(dict.fromkeys(position for _, _, _, _, position in candidate_calls))
+            resolved = dict(zip(
+                unique_positions,
+                await asyncio.gather(
+                    *(cached_definition(server, definition_cache, *position) for position in unique_positions),
+                    return_exceptions=True
+                )
+            ))
+
+            for func_name, node, caller_name, caller, position in candidate_calls:
+                defs = resolved[position]
+                if isinstance(defs, Exception):
+                    logger.log(f"Error verifying call from {caller_name}: {defs}", logging.WARNING)
+                    continue
+
+                # list of locations
+                if debug_enabled:
+                    logger.log("defs: %s" % (defs,), logging.DEBUG)
+
+                # Use language-specific handler to process definition
+                if handler.process_definition(defs, node, position[0], position[1]):
+                    if debug_enabled:
+                        logger.log("  Called by: %s" % caller_name, logging.DEBUG)
+                    # Use unique keys for tracking references
+                    caller_unique_key = f"{caller.file_path}::{caller_name}"
+                    func_unique_key = f"{node.file_path}::{func_name}"
+
+                    if caller_unique_key not in node.incoming:
+                        if debug_enabled:
+                            logger.log("  Adding %s to incoming calls" % caller_unique_key, logging.DEBUG)
+                        node.incoming.add(caller_unique_key)
+                    if func_unique_key not in caller.outgoing:
+                        if debug_enabled:
+                            logger.log("  Adding %s to outgoing calls" % func_unique_key, logging.DEBUG)
+                        caller.outgoing.add(func_unique_key)
+
+
         # Display the dependency graph
         logger.log("\n--- Dependency Graph Results ---", logging.INFO)
         for func_name, node in function_nodes.items():
             logger.log(f"Function: {func_name}", logging.INFO)
             if node.incoming:
-                logger.log(f"  Called by: {', '.join(node.incoming)}", logging.INFO)
+                logger.log(f"  Called by: {', '.join(sorted(node.incoming))}", logging.INFO)
             if node.outgoing:
-                logger.log(f"  Calls: {', '.join(node.outgoing)}", logging.INFO)
+                logger.log(f"  Calls: {', '.join(sorted(node.outgoing))}", logging.INFO)
     
     logger.log("\nAll tests completed successfully!", logging.INFO)
 
 
+@functools.lru_cache(maxsize=4096)
+def _abs(repo_path: str, file_path: str) -> str:
+    """Resolve a repository file path to an absolute path once per (repo_path, file_path)."""
+    abs_file_path = os.path.join(repo_path, file_path)
+    return abs_file_path if os.path.isabs(abs_file_path) else os.path.abspath(abs_file_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_lines(content: str) -> Tuple[str, ...]:
+    """Split source code into lines once per distinct content."""
+    return tuple(content.split('\n'))
+
+
+@functools.lru_cache(maxsize=256)
+def _read_lines(abs_file_path: str, mtime: float) -> Tuple[str, ...]:
+    """Read a file once per modification time and split it into lines."""
+    with open(abs_file_path, 'r') as f:
+        return _split_lines(f.read())
+
+
 def get_function_definition_from_range(repo_path: Optional[str], code_dict: Optional[Dict[str, str]], file_path: str, range_info: dict) -> str:
     """
     Extract full function definition using the range information.
@@ -237,26 +373,23 @@ def get_function_definition_from_range(repo_path: Optional[str], code_dict: Opti
         String containing the full function definition
     """
     try:
-        content = None
+        lines = None
 
         if repo_path:
             # Repository path mode
-            abs_file_path = os.path.join(repo_path, file_path)
-            if not os.path.isabs(abs_file_path):
-                abs_file_path = os.path.abspath(abs_file_path)
-
-            with open(abs_file_path, 'r') as f:
-                content = f.read()
+            abs_file_path = _abs(repo_path, file_path)
+            lines = _read_lines(abs_file_path, os.path.getmtime(abs_file_path))
         else:
             # Code dictionary mode
             if file_path in code_dict:
                 content = code_dict[file_path]
+                if content:
+                    lines = _split_lines(content)
             else:
                 print(f"[WARNING] File {file_path} not found in code dictionary")
                 return ""
 
-        if content:
-            lines = content.split('\n')
+        if lines:
             start_line = range_info['start']['line']
             end_line = range_info['end']['line']
 
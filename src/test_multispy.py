@@ -122,17 +122,17 @@ async def main():
         if os.path.exists(test_path):
             logger.info(f"Examining test file: {test_file}")
             
-            # Read the file to find a reference to Schema
-            with open(test_path, 'r') as f:
-                test_lines = f.readlines()
+            # Find the first reference to Schema with a single search over the raw file contents
+            test_data = Path(test_path).read_bytes()
+            schema_offset = test_data.find(b"Schema")
             
             schema_ref_line = None
             schema_ref_col = None
-            for i, line in enumerate(test_lines):
-                if "Schema" in line:
-                    schema_ref_line = i
-                    schema_ref_col = line.index("Schema") + 1  # Position at "c" in "Schema"
-                    break
+            if schema_offset >= 0:
+                schema_ref_line = test_data.count(b"\n", 0, schema_offset)
+                line_start = test_data.rfind(b"\n", 0, schema_offset) + 1
+                # Columns count characters, so decode the part of the line before the match
+                schema_ref_col = len(test_data[line_start:schema_offset].decode("utf-8")) + 1  # Position at "c" in "Schema"
             
             if schema_ref_line is not None:
                 logger.info(f"Found Schema reference at line {schema_ref_line}, column {schema_ref_col}")
@@ -0,0 +1,68 @@
+"""
+This file contains tests for the on-disk cache used to resolve the clangd executable of the C/C++ Language Server
+"""
+
+import stat
+import pytest
+
+from multilspy.multilspy_logger import MultilspyLogger
+from multilspy.multilspy_settings import MultilspySettings
+from multilspy.language_servers.clangd import clangd
+
+
+class TestLogger(MultilspyLogger):
+    """Simple logger implementation for testing."""
+
+    def __init__(self):
+        self.logs = []
+
+    def log(self, message, level=None):
+        self.logs.append((level, message))
+
+
+def make_clangd(directory) -> str:
+    """
+    Creates an executable named clangd in the given directory and returns its path
+    """
+    directory.mkdir(exist_ok=True)
+    path = directory / "clangd"
+    path.write_text("#!/bin/sh\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir()
+    monkeypatch.setattr(MultilspySettings, "get_global_cache_directory", staticmethod(lambda: str(cache_directory)))
+    clangd._resolve_clangd.cache_clear()
+    yield
+    clangd._resolve_clangd.cache_clear()
+
+
+def test_cache_hit_skips_search(monkeypatch, tmp_path):
+    clangd_path = make_clangd(tmp_path / "bin")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    assert clangd._get_clangd_executable_path(TestLogger()) == clangd_path
+
+    # A new process only has the on-disk cache, which is used without searching again
+    clangd._resolve_clangd.cache_clear()
+
+    def fail_locate(logger, platform_id):
+        raise AssertionError("clangd was searched for despite a valid cache entry")
+
+    monkeypatch.setattr(clangd, "_locate_clangd", fail_locate)
+    assert clangd._get_clangd_executable_path(TestLogger()) == clangd_path
+
+
+def test_path_change_invalidates_cache(monkeypatch, tmp_path):
+    make_clangd(tmp_path / "bin1")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin1"))
+    clangd._get_clangd_executable_path(TestLogger())
+
+    clangd._resolve_clangd.cache_clear()
+    other_clangd_path = make_clangd(tmp_path / "bin2")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin2"))
+    assert clangd._get_clangd_executable_path(TestLogger()) == other_clangd_path
+
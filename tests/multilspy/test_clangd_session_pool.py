@@ -0,0 +1,211 @@
+"""
+This file contains tests for the sharing of clangd sessions between start_server scopes of the C/C++ Language Server
+"""
+
+import asyncio
+import pytest
+
+from multilspy import LanguageServer, SyncLanguageServer
+from multilspy.multilspy_config import MultilspyConfig, Language
+from multilspy.multilspy_logger import MultilspyLogger
+from multilspy.language_servers.clangd import clangd
+from multilspy.language_servers.clangd.clangd import ClangdServer
+
+pytest_plugins = ("pytest_asyncio",)
+
+INITIALIZE_RESPONSE = {"capabilities": {"textDocumentSync": {"change": 2}, "completionProvider": {}}}
+
+
+class TestLogger(MultilspyLogger):
+    """Simple logger implementation for testing."""
+
+    def __init__(self):
+        self.logs = []
+
+    def log(self, message, level=None):
+        self.logs.append((level, message))
+
+
+class FakeClangd:
+    """
+    Stands in for the clangd process of a ClangdServer, counting sessions started and stopped
+    """
+
+    def __init__(self, server: ClangdServer):
+        self.starts = 0
+        self.stops = 0
+        self.running = False
+        self.fail_initialize = False
+        server.server.start = self.start
+        server.server.send.initialize = self.initialize
+        server.server.notify.initialized = lambda params: None
+        server.server.shutdown = self.shutdown
+        server.server.stop = self.stop
+
+    async def start(self):
+        self.starts += 1
+        self.running = True
+
+    async def initialize(self, params):
+        # Yield to the event loop, so concurrent scopes interleave with the handshake
+        await asyncio.sleep(0)
+        if self.fail_initialize:
+            raise RuntimeError("initialize failed")
+        return INITIALIZE_RESPONSE
+
+    async def shutdown(self):
+        pass
+
+    async def stop(self):
+        if self.running:
+            self.stops += 1
+        self.running = False
+
+
+@pytest.fixture
+def make_server(monkeypatch, tmp_path):
+    monkeypatch.setattr(clangd, "_get_clangd_executable_path", lambda logger: "/usr/bin/clangd")
+    monkeypatch.setattr(clangd, "_SESSION_POOL", clangd.OrderedDict())
+    config = MultilspyConfig.from_dict({"code_language": Language.CPP})
+    logger = TestLogger()
+
+    def make(repository_root_path=str(tmp_path), idle_timeout=None):
+        server = LanguageServer.create(config, logger, repository_root_path)
+        if idle_timeout is not None:
+            server.session_idle_timeout = idle_timeout
+        return server, FakeClangd(server)
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_create_returns_pooled_instance(make_server, tmp_path):
+    server, _ = make_server()
+    assert isinstance(server, ClangdServer)
+    assert make_server()[0] is server
+    other = tmp_path / "other"
+    other.mkdir()
+    assert make_server(str(other))[0] is not server
+
+
+def test_pooled_instance_matches_config_and_logger(make_server, tmp_path):
+    server, _ = make_server()
+    config = MultilspyConfig.from_dict({"code_language": Language.CPP})
+    logger = server.logger
+    assert LanguageServer.create(config, logger, str(tmp_path)) is server
+
+    traced = MultilspyConfig.from_dict({"code_language": Language.CPP, "trace_lsp_communication": True})
+    assert LanguageServer.create(traced, logger, str(tmp_path)) is not server
+    assert LanguageServer.create(config, TestLogger(), str(tmp_path)) is not server
+
+
+@pytest.mark.asyncio
+async def test_nested_and_concurrent_scopes_share_one_session(make_server):
+    server, fake = make_server()
+
+    async with server.start_server():
+        async with server.start_server():
+            assert server.server_started
+        assert fake.stops == 0
+    assert (fake.starts, fake.stops) == (1, 1)
+    assert not server.server_started
+
+    entered = asyncio.Event()
+
+    async def use():
+        async with server.start_server():
+            await entered.wait()
+
+    tasks = [asyncio.ensure_future(use()) for _ in range(4)]
+    await asyncio.sleep(0.01)
+    entered.set()
+    await asyncio.gather(*tasks)
+    assert (fake.starts, fake.stops) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_idle_session_is_reused_then_stopped(make_server):
+    server, fake = make_server(idle_timeout=0.05)
+
+    async with server.start_server():
+        pass
+    async with server.start_server():
+        pass
+    assert (fake.starts, fake.stops) == (1, 0)
+
+    await asyncio.sleep(0.2)
+    assert (fake.starts, fake.stops) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_exception_exit_stops_session(make_server):
+    server, fake = make_server(idle_timeout=60)
+
+    with pytest.raises(ValueError):
+        async with server.start_server():
+            raise ValueError()
+    assert (fake.starts, fake.stops) == (1, 1)
+    assert not server.server_started
+
+    server.session_idle_timeout = 0
+    async with server.start_server():
+        assert server.server_started
+    assert (fake.starts, fake.stops) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_failed_start_unwinds_and_can_be_retried(make_server):
+    server, fake = make_server()
+    fake.fail_initialize = True
+
+    with pytest.raises(RuntimeError):
+        async with server.start_server():
+            pass
+    assert (fake.starts, fake.stops) == (1, 1)
+    assert not server.server_started
+    assert server._session_refcount == 0
+
+    fake.fail_initialize = False
+    async with server.start_server():
+        assert server.server_started
+    assert (fake.starts, fake.stops) == (2, 2)
+
+
+def test_sync_api_stops_session_on_scope_exit(make_server):
+    server, fake = make_server()
+    sync_server = SyncLanguageServer(server)
+
+    with sync_server.start_server():
+        assert server.server_started
+    assert (fake.starts, fake.stops) == (1, 1)
+    assert not server.server_started
+
+    # The next scope runs on a new event loop and starts a new session
+    with sync_server.start_server():
+        assert server.server_started
+    assert (fake.starts, fake.stops) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_evicted_idle_session_is_killed(make_server, monkeypatch, tmp_path):
+    monkeypatch.setattr(clangd, "_SESSION_POOL_SIZE", 1)
+    killed = []
+    monkeypatch.setattr(clangd, "_kill_process", killed.append)
+
+    server, fake = make_server(idle_timeout=60)
+    server.server.process = "clangd process"
+    async with server.start_server():
+        server.server.request_id = 7
+        server.server._response_handlers[6] = "pending request"
+    assert fake.stops == 0
+    idle_shutdown_task = server._idle_shutdown_task
+
+    other = tmp_path / "other"
+    other.mkdir()
+    make_server(str(other))
+    assert killed == ["clangd process"]
+    assert (server.server.process, server.server.request_id, server.server._response_handlers) == (None, 1, {})
+    assert server._session_stack is None
+    assert not server.server_started
+    await asyncio.sleep(0)
+    assert idle_shutdown_task.cancelled()
@@ -2,9 +2,10 @@
 This file contains tests for the direct Jedi API implementation of the Python Language Server
 """
 
+import asyncio
 import pytest
 import os
-from pathlib import PurePath
+from pathlib import Path, PurePath
 from multilspy import LanguageServer
 from multilspy.multilspy_config import MultilspyConfig, Language
 from multilspy.multilspy_logger import MultilspyLogger
@@ -49,33 +50,33 @@ async def test_jedi_direct_api_with_current_repo():
         symbols, tree = await server.request_document_symbols(test_file_path)
         assert len(symbols) > 0
         
-        # Find the JediServer class import line
-        with open(__file__, 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
-                if "from multilspy.language_servers.jedi_language_server.jedi_server import JediServer" in line:
-                    definition_line = i
-                    definition_column = line.index("JediServer")
-                    break
+        # Find the JediServer class import line, and a line with "server." for completions, in one pass
+        definition_line = completion_line = None
+        for i, line in enumerate(Path(__file__).read_text().splitlines()):
+            if definition_line is None and "from multilspy.language_servers.jedi_language_server.jedi_server import JediServer" in line:
+                definition_line = i
+                definition_column = line.index("JediServer")
+            if completion_line is None and "server." in line:
+                completion_line = i
+                completion_column = line.index("server.") + 7  # After "server."
+            if definition_line is not None and completion_line is not None:
+                break
+        
+        # The definition, completion and hover requests are independent, so issue them together
+        locations, completions, hover = await asyncio.gather(
+            server.request_definition(test_file_path, definition_line, definition_column),
+            server.request_completions(test_file_path, completion_line, completion_column),
+            server.request_hover(test_file_path, definition_line, definition_column),
+        )
         
         # Test definition
-        locations = await server.request_definition(test_file_path, definition_line, definition_column)
         assert len(locations) > 0
         assert any("jedi_server.py" in location["relativePath"] for location in locations)
         
         # Test completions
-        # Find a line with "server." for completions
-        for i, line in enumerate(lines):
-            if "server." in line:
-                completion_line = i
-                completion_column = line.index("server.") + 7  # After "server."
-                break
-        
-        completions = await server.request_completions(test_file_path, completion_line, completion_column)
         assert len(completions) > 0
         
         # Test hover
-        hover = await server.request_hover(test_file_path, definition_line, definition_column)
         assert hover is not None
 
 
@@ -96,21 +97,25 @@ async def test_jedi_direct_api_with_test_context():
 
         # All the communication with the language server must be performed inside the context manager
         async with server.start_server():
-            # Test definition
-            result = await server.request_definition(str(PurePath("src/black/mode.py")), 163, 4)
+            # The four requests are independent, so issue them together
+            mode_path = str(PurePath("src/black/mode.py"))
+            definitions, references, (symbols, tree), completions = await asyncio.gather(
+                server.request_definition(mode_path, 163, 4),
+                server.request_references(mode_path, 163, 4),
+                server.request_document_symbols(mode_path),
+                server.request_completions(mode_path, 163, 4),
+            )
 
-            assert isinstance(result, list)
-            assert len(result) > 0
+            # Test definition
+            assert isinstance(definitions, list)
+            assert len(definitions) > 0
             
             # Test references
-            result = await server.request_references(str(PurePath("src/black/mode.py")), 163, 4)
-            assert isinstance(result, list)
-            assert len(result) > 0
+            assert isinstance(references, list)
+            assert len(references) > 0
             
             # Test document symbols
-            symbols, tree = await server.request_document_symbols(str(PurePath("src/black/mode.py")))
             assert len(symbols) > 0
             
             # Test completions
-            completions = await server.request_completions(str(PurePath("src/black/mode.py")), 163, 4)
             assert isinstance(completions, list)
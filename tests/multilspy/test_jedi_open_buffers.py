@@ -0,0 +1,81 @@
+"""
+This file contains tests for how the direct Jedi API implementation of the Python Language Server
+tracks open file buffers and edits made to files on disk
+"""
+
+import os
+import pytest
+
+from multilspy.multilspy_config import MultilspyConfig, Language
+from multilspy.multilspy_logger import MultilspyLogger
+from multilspy.multilspy_settings import MultilspySettings
+from multilspy.language_servers.jedi_language_server.jedi_server import JediServer
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class TestLogger(MultilspyLogger):
+    """Simple logger implementation for testing."""
+
+    def __init__(self):
+        self.logs = []
+
+    def log(self, message, level=None):
+        self.logs.append((level, message))
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir()
+    monkeypatch.setattr(MultilspySettings, "get_global_cache_directory", staticmethod(lambda: str(cache_directory)))
+
+    repository = tmp_path / "repo"
+    repository.mkdir()
+    (repository / "m.py").write_text("def alpha():\n    return 1\n")
+    config = MultilspyConfig.from_dict({"code_language": Language.PYTHON})
+    return JediServer(config, TestLogger(), str(repository))
+
+
+async def symbol_names(server: JediServer, relative_file_path: str):
+    symbols, _ = await server.request_document_symbols(relative_file_path)
+    return [symbol["name"] for symbol in symbols]
+
+
+@pytest.mark.asyncio
+async def test_symbols_follow_open_buffer_edits(server):
+    """
+    Edits to an open buffer are visible to requests, and closing the buffer reverts to the contents on disk
+    """
+    async with server.start_server():
+        assert await symbol_names(server, "m.py") == ["alpha"]
+
+        with server.open_file("m.py"):
+            server.insert_text_at_position("m.py", 2, 0, "def beta():\n    pass\n")
+            assert await symbol_names(server, "m.py") == ["alpha", "beta"]
+
+            server.delete_text_between_positions("m.py", {"line": 0, "character": 0}, {"line": 2, "character": 0})
+            assert await symbol_names(server, "m.py") == ["beta"]
+
+        assert await symbol_names(server, "m.py") == ["alpha"]
+
+
+@pytest.mark.asyncio
+async def test_symbols_follow_disk_edits(server):
+    """
+    A cached Script is rebuilt once the file it was built from changes on disk
+    """
+    file_path = os.path.join(server.repository_root_path, "m.py")
+    async with server.start_server():
+        assert await symbol_names(server, "m.py") == ["alpha"]
+
+        with open(file_path, "w") as f:
+            f.write("def gamma():\n    return 2\n")
+        # Same size as before, so only the changed mtime reveals the edit
+        st = os.stat(file_path)
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert await symbol_names(server, "m.py") == ["gamma"]
+
+        with open(file_path, "a") as f:
+            f.write("\n\nclass Delta:\n    pass\n")
+        assert await symbol_names(server, "m.py") == ["gamma", "Delta"]
@@ -0,0 +1,136 @@
+"""
+This file contains tests for the persistent parse cache used by the direct Jedi API implementation
+"""
+
+import hashlib
+from pathlib import Path
+
+import jedi
+import parso
+import pytest
+from parso.cache import parser_cache
+
+from multilspy.multilspy_config import MultilspyConfig, Language
+from multilspy.multilspy_logger import MultilspyLogger
+from multilspy.multilspy_settings import MultilspySettings
+from multilspy.language_servers.jedi_language_server.jedi_server import JediServer, _PersistentParseCache
+
+pytest_plugins = ("pytest_asyncio",)
+
+SOURCE = "def alpha():\n    return 1\n"
+
+
+class TestLogger(MultilspyLogger):
+    """Simple logger implementation for testing."""
+
+    def __init__(self):
+        self.logs = []
+
+    def log(self, message, level=None):
+        self.logs.append((level, message))
+
+
+def _parse(tmp_path: Path):
+    """
+    Writes the sample module, parses it through Jedi and returns its path, the grammar hash and the source digest
+    """
+    module_path = (tmp_path / "m.py").absolute()
+    module_path.write_text(SOURCE)
+    project = jedi.Project(str(tmp_path))
+    hashed_grammar = project.get_environment().get_grammar()._hashed
+    jedi.Script(code=SOURCE, path=str(module_path), project=project)
+    return module_path, project, hashed_grammar, hashlib.sha256(SOURCE.encode("utf-8")).digest()
+
+
+def test_seeded_tree_is_reused_by_jedi(tmp_path):
+    """
+    A tree stored in one session and seeded in the next is the module node Jedi works on
+    """
+    module_path, project, hashed_grammar, sha = _parse(tmp_path)
+    cache = _PersistentParseCache(str(tmp_path / "cache" / "parse_cache.db"))
+    try:
+        cache.store(hashed_grammar, module_path, sha)
+        del parser_cache[hashed_grammar][module_path]
+
+        assert cache.seed(hashed_grammar, module_path, SOURCE, sha)
+        seeded_node = parser_cache[hashed_grammar][module_path].node
+        script = jedi.Script(code=SOURCE, path=str(module_path), project=project)
+        assert script._module_node is seeded_node
+        assert [name.name for name in script.get_names()] == ["alpha"]
+    finally:
+        cache.close()
+        parser_cache.get(hashed_grammar, {}).pop(module_path, None)
+
+
+def test_seed_requires_matching_source_grammar_and_parso_version(tmp_path):
+    """
+    Stored trees are only seeded for the source digest, grammar and parso version they were built with
+    """
+    module_path, _, hashed_grammar, sha = _parse(tmp_path)
+    db_path = str(tmp_path / "cache" / "parse_cache.db")
+    cache = _PersistentParseCache(db_path)
+    try:
+        cache.store(hashed_grammar, module_path, sha)
+        del parser_cache[hashed_grammar][module_path]
+
+        assert not cache.seed(hashed_grammar, module_path, SOURCE, hashlib.sha256(b"changed").digest())
+        assert not cache.seed("other-grammar", module_path, SOURCE, sha)
+        assert module_path not in parser_cache.get("other-grammar", {})
+    finally:
+        cache.close()
+        parser_cache.pop("other-grammar", None)
+
+    # Reopening the cache under a different parso version discards trees pickled by the previous one
+    cache = _PersistentParseCache(db_path)
+    try:
+        cache.connection.execute("UPDATE parse_trees SET parso_version = ?", ("0.0.0",))
+        cache.connection.commit()
+        assert not cache.seed(hashed_grammar, module_path, SOURCE, sha)
+    finally:
+        cache.close()
+    cache = _PersistentParseCache(db_path)
+    try:
+        assert cache.connection.execute("SELECT COUNT(*) FROM parse_trees").fetchone()[0] == 0
+        assert cache._parso_version == parso.__version__
+    finally:
+        cache.close()
+        parser_cache.get(hashed_grammar, {}).pop(module_path, None)
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_share_the_parse_cache(monkeypatch, tmp_path):
+    """
+    The parse cache opened by the outermost start_server scope stays open until that scope exits
+    """
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir()
+    monkeypatch.setattr(MultilspySettings, "get_global_cache_directory", staticmethod(lambda: str(cache_directory)))
+    server = JediServer(MultilspyConfig.from_dict({"code_language": Language.PYTHON}), TestLogger(), str(tmp_path))
+
+    async with server.start_server():
+        parse_cache = server._parse_cache
+        assert parse_cache is not None
+        async with server.start_server():
+            assert server._parse_cache is parse_cache
+        assert server._parse_cache is parse_cache
+        parse_cache.connection.execute("SELECT COUNT(*) FROM parse_trees")
+    assert server._parse_cache is None
+
+
+@pytest.mark.asyncio
+async def test_parso_cache_directory_is_restored(monkeypatch, tmp_path):
+    """
+    The repository's parso cache directory is only set while Jedi works for the server
+    """
+    cache_directory = tmp_path / "cache"
+    cache_directory.mkdir()
+    monkeypatch.setattr(MultilspySettings, "get_global_cache_directory", staticmethod(lambda: str(cache_directory)))
+    (tmp_path / "m.py").write_text(SOURCE)
+    server = JediServer(MultilspyConfig.from_dict({"code_language": Language.PYTHON}), TestLogger(), str(tmp_path))
+    previous_cache_directory = jedi.settings.cache_directory
+
+    async with server.start_server():
+        symbols, _ = await server.request_document_symbols("m.py")
+        assert [symbol["name"] for symbol in symbols] == ["alpha"]
+        assert jedi.settings.cache_directory == previous_cache_directory
+    assert jedi.settings.cache_directory == previous_cache_directory